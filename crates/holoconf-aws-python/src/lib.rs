@@ -29,7 +29,9 @@ fn register_ssm(force: bool) -> PyResult<()> {
     let resolver = Arc::new(SsmResolver::new());
     register_global(resolver, force).map_err(|e| {
         pyo3::exceptions::PyRuntimeError::new_err(format!("Failed to register SSM resolver: {}", e))
-    })
+    })?;
+    holoconf_aws::prewarm_ssm();
+    Ok(())
 }
 
 /// Register the CloudFormation resolver in the global registry.
@@ -170,10 +172,30 @@ fn cfn(endpoint: Option<String>, region: Option<String>, profile: Option<String>
     holoconf_aws::configure_cfn(endpoint, region, profile);
 }
 
+/// Check that a path is a valid SSM parameter path.
+///
+/// Applies the same rule as the `ssm` resolver: parameter paths must be absolute
+/// (start with `/`).
+///
+/// Args:
+///     path: The parameter path to check
+///
+/// Raises:
+///     ValueError: If the path is not a valid SSM parameter path
+///
+/// Example:
+///     >>> import holoconf_aws
+///     >>> holoconf_aws.validate_ssm_path("/app/prod/db-password")
+#[pyfunction]
+fn validate_ssm_path(path: &str) -> PyResult<()> {
+    holoconf_aws::validate_ssm_path(path)
+        .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))
+}
+
 /// Reset all configuration and clear the client cache.
 ///
-/// Clears all global and service-specific configuration, and removes all cached AWS clients.
-/// Useful for test isolation.
+/// Clears all global and service-specific configuration, and removes all cached AWS clients
+/// and SSM parameters. Useful for test isolation.
 ///
 /// Example:
 ///     >>> import holoconf_aws
@@ -197,5 +219,6 @@ fn _holoconf_aws(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(ssm, m)?)?;
     m.add_function(wrap_pyfunction!(cfn, m)?)?;
     m.add_function(wrap_pyfunction!(reset, m)?)?;
+    m.add_function(wrap_pyfunction!(validate_ssm_path, m)?)?;
     Ok(())
 }
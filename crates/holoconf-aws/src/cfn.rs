@@ -2,15 +2,38 @@
 //!
 //! Provides the `cfn` resolver for fetching outputs from CloudFormation stacks.
 
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::sync::Arc;
 
 use holoconf_core::error::{Error, Result};
-use holoconf_core::resolver::{register_global, ResolvedValue, Resolver, ResolverContext};
+use holoconf_core::resolver::{
+    register_global, ResolvedValue, Resolver, ResolverCall, ResolverContext,
+};
 use holoconf_core::Value;
-use tokio::runtime::Runtime;
+use once_cell::sync::Lazy;
+use tokio::sync::Semaphore;
+use tokio::task::JoinSet;
 
-use crate::client_cache;
+use crate::prefetch::{self, PrefetchStore};
+use crate::{client_cache, runtime};
+
+/// Client settings an output is fetched with: (endpoint, region, profile)
+type ClientKey = (Option<String>, Option<String>, Option<String>);
+
+/// Prefetch key: (stack name, output key, client settings)
+type OutputKey = (String, String, ClientKey);
+
+/// Outputs fetched by `prefetch`, waiting for their `resolve` call.
+static PREFETCHED: Lazy<PrefetchStore<OutputKey, String>> = Lazy::new(PrefetchStore::new);
+
+/// Split a `stack-name/OutputKey` argument, rejecting empty parts.
+fn parse_stack_output(arg: &str) -> Option<(&str, &str)> {
+    let (stack_name, output_key) = arg.split_once('/')?;
+    if stack_name.is_empty() || output_key.is_empty() {
+        return None;
+    }
+    Some((stack_name, output_key))
+}
 
 /// CloudFormation outputs resolver.
 ///
@@ -30,15 +53,12 @@ use crate::client_cache;
 /// - `profile`: Use a specific AWS profile
 /// - `default`: Value to use if output not found (framework-handled)
 /// - `sensitive`: Mark value as sensitive (framework-handled)
-pub struct CfnResolver {
-    runtime: Runtime,
-}
+pub struct CfnResolver;
 
 impl CfnResolver {
     /// Create a new CloudFormation resolver.
     pub fn new() -> Self {
-        let runtime = Runtime::new().expect("Failed to create Tokio runtime");
-        Self { runtime }
+        Self
     }
 
     /// Fetch a stack output from CloudFormation.
@@ -126,8 +146,7 @@ impl Resolver for CfnResolver {
         let arg = &args[0];
 
         // Parse stack-name/OutputKey format
-        let parts: Vec<&str> = arg.splitn(2, '/').collect();
-        if parts.len() != 2 {
+        let Some((stack_name, output_key)) = parse_stack_output(arg) else {
             return Err(Error::resolver_custom(
                 "cfn",
                 format!(
@@ -135,36 +154,30 @@ impl Resolver for CfnResolver {
                     arg
                 ),
             ));
-        }
-
-        let stack_name = parts[0];
-        let output_key = parts[1];
-
-        if stack_name.is_empty() || output_key.is_empty() {
-            return Err(Error::resolver_custom(
-                "cfn",
-                format!(
-                    "CloudFormation argument must be in stack-name/OutputKey format: {}",
-                    arg
-                ),
-            ));
-        }
+        };
 
         // Resolve configuration with precedence: kwargs > service config > global config
-        let (endpoint, region, profile) = crate::resolve_cfn_config(
+        let client_key = crate::resolve_cfn_config(
             kwargs.get("endpoint").map(|s| s.as_str()),
             kwargs.get("region").map(|s| s.as_str()),
             kwargs.get("profile").map(|s| s.as_str()),
         );
 
-        // Fetch the output using the async runtime
-        let value = self.runtime.block_on(self.fetch_output(
-            stack_name,
-            output_key,
-            region,
-            profile,
-            endpoint.as_deref(),
-        ))?;
+        let key = (stack_name.to_string(), output_key.to_string(), client_key);
+        let value = match PREFETCHED.take(&key) {
+            Some(value) => value,
+            None => {
+                // Fetch the output using the async runtime
+                let (_, _, (endpoint, region, profile)) = key;
+                runtime::block_on(self.fetch_output(
+                    stack_name,
+                    output_key,
+                    region,
+                    profile,
+                    endpoint.as_deref(),
+                ))?
+            }
+        };
 
         // CloudFormation outputs are not sensitive by default
         Ok(ResolvedValue::new(Value::String(value)))
@@ -173,6 +186,101 @@ impl Resolver for CfnResolver {
     fn name(&self) -> &str {
         "cfn"
     }
+
+    fn prefetch(&self, calls: &[ResolverCall]) {
+        // Group requested outputs by the stack (and client) they come from
+        let mut stacks: HashMap<(String, ClientKey), HashSet<String>> = HashMap::new();
+        for call in calls {
+            // Invalid arguments error in resolve
+            let Some((stack_name, output_key)) =
+                call.args.first().and_then(|arg| parse_stack_output(arg))
+            else {
+                continue;
+            };
+            let client_key = crate::resolve_cfn_config(
+                call.kwargs.get("endpoint").map(|s| s.as_str()),
+                call.kwargs.get("region").map(|s| s.as_str()),
+                call.kwargs.get("profile").map(|s| s.as_str()),
+            );
+            stacks
+                .entry((stack_name.to_string(), client_key))
+                .or_default()
+                .insert(output_key.to_string());
+        }
+
+        // A single output gains nothing over the DescribeStacks call in resolve
+        if stacks.values().map(HashSet::len).sum::<usize>() < 2 {
+            return;
+        }
+
+        let fetched = runtime::block_on(fetch_stacks(stacks));
+        for (key, value) in fetched {
+            PREFETCHED.insert(key, value);
+        }
+    }
+}
+
+/// Describe many stacks concurrently, keeping only the requested outputs.
+///
+/// At most `HOLOCONF_AWS_CONCURRENCY` (default 16) requests run at a time. Missing
+/// stacks and outputs are left out of the result; `resolve` fetches those itself
+/// and reports the error there.
+async fn fetch_stacks(
+    stacks: HashMap<(String, ClientKey), HashSet<String>>,
+) -> Vec<(OutputKey, String)> {
+    let permits = Arc::new(Semaphore::new(*prefetch::CONCURRENCY));
+
+    let mut requests = JoinSet::new();
+    for ((stack_name, client_key), output_keys) in stacks {
+        let permits = Arc::clone(&permits);
+        requests.spawn(async move {
+            let _permit = permits.acquire_owned().await.ok()?;
+            let (endpoint, region, profile) = &client_key;
+            let client: aws_sdk_cloudformation::Client =
+                client_cache::get_client(region.clone(), profile.clone(), endpoint.as_deref())
+                    .await;
+            let response = client
+                .describe_stacks()
+                .stack_name(&stack_name)
+                .send()
+                .await
+                .ok()?;
+
+            let stack = response.stacks().first()?;
+            let outputs: Vec<(OutputKey, String)> = stack
+                .outputs()
+                .iter()
+                .filter_map(|output| {
+                    let output_key = output.output_key()?;
+                    if !output_keys.contains(output_key) {
+                        return None;
+                    }
+                    let key = (
+                        stack_name.clone(),
+                        output_key.to_string(),
+                        client_key.clone(),
+                    );
+                    Some((key, output.output_value()?.to_string()))
+                })
+                .collect();
+            Some(outputs)
+        });
+    }
+
+    let mut fetched = Vec::new();
+    while let Some(result) = requests.join_next().await {
+        if let Ok(Some(outputs)) = result {
+            fetched.extend(outputs);
+        }
+    }
+    fetched
+}
+
+/// Discard prefetched outputs.
+///
+/// Called by `reset()`.
+pub(crate) fn clear() {
+    PREFETCHED.clear();
 }
 
 /// Register the CloudFormation resolver in the global registry.
@@ -247,6 +355,21 @@ mod tests {
             .contains("stack-name/OutputKey"));
     }
 
+    #[test]
+    fn test_parse_stack_output() {
+        assert_eq!(
+            parse_stack_output("my-stack/Endpoint"),
+            Some(("my-stack", "Endpoint"))
+        );
+        assert_eq!(
+            parse_stack_output("my-stack/a/b"),
+            Some(("my-stack", "a/b"))
+        );
+        assert_eq!(parse_stack_output("my-stack"), None);
+        assert_eq!(parse_stack_output("/Endpoint"), None);
+        assert_eq!(parse_stack_output("my-stack/"), None);
+    }
+
     #[test]
     fn test_register_doesnt_panic() {
         // Just verify registration doesn't panic
@@ -2,17 +2,41 @@
 //!
 //! Caches actual service clients (not just SdkConfig) to enable connection pool reuse.
 //! Each unique (service, region, profile, endpoint) combination gets its own cached client.
+//!
+//! The `SdkConfig` behind those clients is cached separately, per (region, profile,
+//! endpoint), so the SSM, CloudFormation and S3 clients for the same settings share
+//! one credentials provider and identity cache: the credential chain (environment,
+//! profile files, instance metadata) runs once rather than once per service.
+//!
+//! The SDK's default HTTP connector does not cap connections per host, so concurrent
+//! requests on a cached client (e.g. SSM prefetch batches) never discard pooled
+//! connections; idle keep-alive connections are reused instead of paying a new
+//! TCP/TLS handshake per request.
 
 use std::any::{Any, TypeId};
 use std::collections::HashMap;
 use std::sync::RwLock;
 
+use aws_config::retry::RetryConfig;
 use aws_config::{BehaviorVersion, SdkConfig};
 use once_cell::sync::Lazy;
 
+/// Maximum attempts per AWS request, including the initial one.
+///
+/// Adaptive retry mode adds client-side rate limiting, which keeps large configs
+/// with many AWS references from tripping service throttling limits.
+const MAX_ATTEMPTS: u32 = 10;
+
 /// Cache key: (service TypeId, region, profile, endpoint)
 type CacheKey = (TypeId, Option<String>, Option<String>, Option<String>);
 
+/// Config cache key: (region, profile, endpoint)
+type ConfigKey = (Option<String>, Option<String>, Option<String>);
+
+/// Global cache of loaded SDK configs, shared by all service clients.
+static CONFIG_CACHE: Lazy<RwLock<HashMap<ConfigKey, SdkConfig>>> =
+    Lazy::new(|| RwLock::new(HashMap::new()));
+
 /// Global cache storing type-erased AWS clients.
 static CLIENT_CACHE: Lazy<RwLock<HashMap<CacheKey, Box<dyn Any + Send + Sync>>>> =
     Lazy::new(|| RwLock::new(HashMap::new()));
@@ -48,7 +72,9 @@ impl AwsClient for aws_sdk_s3::Client {
 
 /// Get or create an AWS client for the given region/profile/endpoint.
 ///
-/// Clients are cached and reused, including their HTTP connection pools.
+/// Clients are cached and reused, including their HTTP connection pools, so only
+/// the first lookup for a given combination pays the config/credential loading cost.
+/// Clients use adaptive retries (see [`MAX_ATTEMPTS`]).
 /// The client type is inferred from the return type annotation.
 ///
 /// # Arguments
@@ -71,11 +97,12 @@ pub async fn get_client<C: AwsClient>(
     profile: Option<String>,
     endpoint: Option<&str>,
 ) -> C {
-    let key = (
+    // The key owns the settings so the cache-hit path doesn't copy them
+    let key: CacheKey = (
         TypeId::of::<C>(),
-        region.clone(),
-        profile.clone(),
-        endpoint.map(|s| s.to_string()),
+        region,
+        profile,
+        endpoint.map(String::from),
     );
 
     // Try read lock first (fast path for cached clients)
@@ -89,14 +116,44 @@ pub async fn get_client<C: AwsClient>(
     }
 
     // Build new client (slow path - only on first access)
-    let mut config_loader = aws_config::defaults(BehaviorVersion::latest());
+    let (_, region, profile, endpoint) = &key;
+    let sdk_config = get_sdk_config(region, profile, endpoint).await;
+    let client = C::from_sdk_config(&sdk_config);
+
+    // Cache for future use
+    {
+        let mut cache = CLIENT_CACHE.write().unwrap();
+        // Double-check after acquiring write lock (another thread may have inserted)
+        cache.entry(key).or_insert_with(|| Box::new(client.clone()));
+    }
+
+    client
+}
+
+/// Get or load the SDK config for the given region/profile/endpoint.
+async fn get_sdk_config(
+    region: &Option<String>,
+    profile: &Option<String>,
+    endpoint: &Option<String>,
+) -> SdkConfig {
+    let key: ConfigKey = (region.clone(), profile.clone(), endpoint.clone());
+
+    {
+        let cache = CONFIG_CACHE.read().unwrap();
+        if let Some(sdk_config) = cache.get(&key) {
+            return sdk_config.clone();
+        }
+    }
+
+    let mut config_loader = aws_config::defaults(BehaviorVersion::latest())
+        .retry_config(RetryConfig::adaptive().with_max_attempts(MAX_ATTEMPTS));
 
     if let Some(region) = region {
-        config_loader = config_loader.region(aws_config::Region::new(region));
+        config_loader = config_loader.region(aws_config::Region::new(region.clone()));
     }
 
     if let Some(profile) = profile {
-        config_loader = config_loader.profile_name(&profile);
+        config_loader = config_loader.profile_name(profile);
     }
 
     if let Some(endpoint) = endpoint {
@@ -104,24 +161,35 @@ pub async fn get_client<C: AwsClient>(
     }
 
     let sdk_config = config_loader.load().await;
-    let client = C::from_sdk_config(&sdk_config);
 
-    // Cache for future use
-    {
-        let mut cache = CLIENT_CACHE.write().unwrap();
-        // Double-check after acquiring write lock (another thread may have inserted)
-        cache.entry(key).or_insert_with(|| Box::new(client.clone()));
-    }
+    // Another task may have loaded the same config meanwhile; keep the first one
+    let mut cache = CONFIG_CACHE.write().unwrap();
+    cache.entry(key).or_insert(sdk_config).clone()
+}
 
-    client
+/// Build and cache a client on a background thread.
+///
+/// Loading AWS config can probe environment variables, profile files and the
+/// instance metadata service; starting early overlaps that with config parsing,
+/// so the first lookup finds the client already cached.
+#[cfg(feature = "ssm")]
+pub(crate) fn prewarm<C: AwsClient>(
+    region: Option<String>,
+    profile: Option<String>,
+    endpoint: Option<String>,
+) {
+    std::thread::spawn(move || {
+        crate::runtime::block_on(get_client::<C>(region, profile, endpoint.as_deref()));
+    });
 }
 
 /// Clear the entire client cache.
 ///
-/// Called by `reset()` to remove all cached clients.
+/// Called by `reset()` to remove all cached clients and SDK configs.
 pub(crate) fn clear() {
     let mut cache = CLIENT_CACHE.write().unwrap();
     cache.clear();
+    CONFIG_CACHE.write().unwrap().clear();
 }
 
 #[cfg(test)]
@@ -33,6 +33,12 @@ use std::sync::RwLock;
 
 mod client_cache;
 
+#[cfg(any(feature = "ssm", feature = "cfn", feature = "s3"))]
+mod prefetch;
+
+#[cfg(any(feature = "ssm", feature = "cfn", feature = "s3"))]
+mod runtime;
+
 #[cfg(feature = "ssm")]
 mod ssm;
 
@@ -43,7 +49,7 @@ mod cfn;
 mod s3;
 
 #[cfg(feature = "ssm")]
-pub use ssm::SsmResolver;
+pub use ssm::{prewarm as prewarm_ssm, validate_ssm_path, SsmResolver};
 
 #[cfg(feature = "cfn")]
 pub use cfn::CfnResolver;
@@ -243,8 +249,8 @@ pub fn configure_cfn(endpoint: Option<String>, region: Option<String>, profile:
 
 /// Reset all configuration and clear the client cache.
 ///
-/// Clears all global and service-specific configuration, and removes all cached AWS clients.
-/// Useful for test isolation.
+/// Clears all global and service-specific configuration, and removes all cached AWS clients,
+/// cached SSM parameters and prefetched values. Useful for test isolation.
 ///
 /// # Example
 ///
@@ -267,6 +273,15 @@ pub fn reset() {
     *SSM_CONFIG.write().unwrap() = Default::default();
     *CFN_CONFIG.write().unwrap() = Default::default();
     client_cache::clear();
+
+    #[cfg(feature = "ssm")]
+    ssm::clear();
+
+    #[cfg(feature = "cfn")]
+    cfn::clear();
+
+    #[cfg(feature = "s3")]
+    s3::clear();
 }
 
 /// Helper trait to access service-specific configuration.
@@ -318,8 +333,8 @@ impl ServiceConfig for CfnConfig {
 ///
 /// This function minimizes allocations by:
 /// 1. Early return if all kwargs provided (no config access needed)
-/// 2. Releasing locks before applying precedence logic (reduces lock contention)
-/// 3. Only cloning values that will actually be used in the precedence chain
+/// 2. Only cloning the value that wins each precedence chain, so the common
+///    case of no overrides and no configuration allocates nothing
 fn resolve_config_with_precedence<T: ServiceConfig>(
     service_config: &RwLock<T>,
     endpoint_kwarg: Option<&str>,
@@ -335,33 +350,31 @@ fn resolve_config_with_precedence<T: ServiceConfig>(
         );
     }
 
-    // Acquire locks and extract values, then drop locks immediately
-    let (endpoint_service, region_service, profile_service, region_global, profile_global) = {
-        let global = GLOBAL_CONFIG.read().unwrap();
-        let service = service_config.read().unwrap();
+    let global = GLOBAL_CONFIG.read().unwrap();
+    let service = service_config.read().unwrap();
 
-        (
-            service.endpoint().clone(),
-            service.region().clone(),
-            service.profile().clone(),
-            global.region.clone(),
-            global.profile.clone(),
-        )
-        // Locks dropped here
+    let endpoint = match endpoint_kwarg {
+        Some(endpoint) => Some(endpoint.to_string()),
+        None => service.endpoint().clone(),
     };
 
-    // Apply precedence without holding any locks
-    let endpoint = endpoint_kwarg.map(String::from).or(endpoint_service);
-
-    let region = region_kwarg
-        .map(String::from)
-        .or(region_service)
-        .or(region_global);
+    let region = match region_kwarg {
+        Some(region) => Some(region.to_string()),
+        None => service
+            .region()
+            .as_ref()
+            .or(global.region.as_ref())
+            .cloned(),
+    };
 
-    let profile = profile_kwarg
-        .map(String::from)
-        .or(profile_service)
-        .or(profile_global);
+    let profile = match profile_kwarg {
+        Some(profile) => Some(profile.to_string()),
+        None => service
+            .profile()
+            .as_ref()
+            .or(global.profile.as_ref())
+            .cloned(),
+    };
 
     (endpoint, region, profile)
 }
@@ -0,0 +1,105 @@
+//! Shared support for `Resolver::prefetch` implementations.
+//!
+//! Resolvers fetch values concurrently during prefetch and park them in a
+//! [`PrefetchStore`]; the matching `resolve` call takes them out again.
+
+use std::collections::HashMap;
+use std::hash::Hash;
+use std::sync::Mutex;
+use std::time::{Duration, Instant};
+
+use once_cell::sync::Lazy;
+
+/// Default number of concurrent AWS requests issued by a prefetch pass.
+const DEFAULT_CONCURRENCY: usize = 16;
+
+/// How long a prefetched value waits for its `resolve` call before it is discarded.
+///
+/// Prefetch runs immediately before resolution, so this only guards against
+/// serving stale data after a resolution pass was interrupted by an error.
+const MAX_AGE: Duration = Duration::from_secs(60);
+
+/// Number of concurrent requests issued by a prefetch pass, from
+/// `HOLOCONF_AWS_CONCURRENCY`.
+pub(crate) static CONCURRENCY: Lazy<usize> = Lazy::new(|| {
+    std::env::var("HOLOCONF_AWS_CONCURRENCY")
+        .ok()
+        .and_then(|n| n.parse().ok())
+        .filter(|n| *n > 0)
+        .unwrap_or(DEFAULT_CONCURRENCY)
+});
+
+/// Values fetched by `prefetch`, each consumed by the `resolve` call it was fetched for.
+///
+/// Entries that are never taken (for example when resolution fails partway)
+/// are dropped once they are older than [`MAX_AGE`], so they don't pin
+/// fetched data in memory for the life of the process.
+pub(crate) struct PrefetchStore<K, V> {
+    entries: Mutex<HashMap<K, (V, Instant)>>,
+    max_age: Duration,
+}
+
+impl<K: Eq + Hash, V> PrefetchStore<K, V> {
+    pub(crate) fn new() -> Self {
+        Self {
+            entries: Mutex::new(HashMap::new()),
+            max_age: MAX_AGE,
+        }
+    }
+
+    /// Park a prefetched value, dropping any entries that have expired.
+    pub(crate) fn insert(&self, key: K, value: V) {
+        let mut entries = self.entries.lock().unwrap();
+        entries.retain(|_, (_, fetched_at)| fetched_at.elapsed() < self.max_age);
+        entries.insert(key, (value, Instant::now()));
+    }
+
+    /// Take a prefetched value, if one is waiting and still fresh.
+    pub(crate) fn take(&self, key: &K) -> Option<V> {
+        let (value, fetched_at) = self.entries.lock().unwrap().remove(key)?;
+        (fetched_at.elapsed() < self.max_age).then_some(value)
+    }
+
+    /// Remove all entries.
+    pub(crate) fn clear(&self) {
+        self.entries.lock().unwrap().clear();
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_prefetch_store_take_consumes() {
+        let store = PrefetchStore::new();
+        store.insert("bucket/key", 1);
+
+        assert_eq!(store.take(&"bucket/key"), Some(1));
+        assert_eq!(store.take(&"bucket/key"), None);
+    }
+
+    #[test]
+    fn test_prefetch_store_drops_expired_entries() {
+        let store = PrefetchStore {
+            entries: Mutex::new(HashMap::new()),
+            max_age: Duration::from_millis(1),
+        };
+        store.insert("bucket/untaken", 1);
+        std::thread::sleep(Duration::from_millis(5));
+        store.insert("bucket/key", 2);
+
+        let entries = store.entries.lock().unwrap();
+        assert_eq!(entries.len(), 1);
+        assert!(entries.contains_key("bucket/key"));
+    }
+
+    #[test]
+    fn test_prefetch_store_clear() {
+        let store = PrefetchStore::new();
+        store.insert("bucket/key", 1);
+        store.clear();
+
+        assert_eq!(store.take(&"bucket/key"), None);
+    }
+}
@@ -0,0 +1,18 @@
+//! Tokio runtime shared by the AWS resolvers.
+//!
+//! Resolvers are synchronous, so each one drives its async SDK calls with
+//! [`block_on`]. One runtime (and one worker pool) serves all of them.
+
+use std::future::Future;
+
+use once_cell::sync::Lazy;
+use tokio::runtime::Runtime;
+
+/// Created on first use so registering resolvers doesn't start a thread pool.
+static RUNTIME: Lazy<Runtime> =
+    Lazy::new(|| Runtime::new().expect("Failed to create Tokio runtime"));
+
+/// Run a future to completion on the shared runtime.
+pub(crate) fn block_on<F: Future>(future: F) -> F::Output {
+    RUNTIME.block_on(future)
+}
@@ -2,16 +2,42 @@
 //!
 //! Provides the `s3` resolver for fetching objects from Amazon S3.
 
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::sync::Arc;
 
 use aws_sdk_s3::primitives::ByteStream;
 use holoconf_core::error::{Error, Result};
-use holoconf_core::resolver::{register_global, ResolvedValue, Resolver, ResolverContext};
+use holoconf_core::resolver::{
+    register_global, ResolvedValue, Resolver, ResolverCall, ResolverContext,
+};
 use holoconf_core::Value;
-use tokio::runtime::Runtime;
+use once_cell::sync::Lazy;
+use tokio::sync::Semaphore;
+use tokio::task::JoinSet;
 
-use crate::client_cache;
+use crate::prefetch::{self, PrefetchStore};
+use crate::{client_cache, runtime};
+
+/// Client settings an object is fetched with: (endpoint, region, profile)
+type ClientKey = (Option<String>, Option<String>, Option<String>);
+
+/// Prefetch key: (bucket, object key, client settings)
+type ObjectKey = (String, String, ClientKey);
+
+/// A fetched object: (body, content type)
+type Object = (Vec<u8>, Option<String>);
+
+/// Objects fetched by `prefetch`, waiting for their `resolve` call.
+static PREFETCHED: Lazy<PrefetchStore<ObjectKey, Object>> = Lazy::new(PrefetchStore::new);
+
+/// Split a `bucket/key` argument, rejecting empty parts.
+fn parse_bucket_key(arg: &str) -> Option<(&str, &str)> {
+    let (bucket, key) = arg.split_once('/')?;
+    if bucket.is_empty() || key.is_empty() {
+        return None;
+    }
+    Some((bucket, key))
+}
 
 /// S3 object resolver.
 ///
@@ -40,15 +66,12 @@ use crate::client_cache;
 /// - `profile`: Use a specific AWS profile
 /// - `default`: Value to use if object not found (framework-handled)
 /// - `sensitive`: Mark value as sensitive (framework-handled)
-pub struct S3Resolver {
-    runtime: Runtime,
-}
+pub struct S3Resolver;
 
 impl S3Resolver {
     /// Create a new S3 resolver.
     pub fn new() -> Self {
-        let runtime = Runtime::new().expect("Failed to create Tokio runtime");
-        Self { runtime }
+        Self
     }
 
     /// Fetch an object from S3 as raw bytes.
@@ -59,7 +82,7 @@ impl S3Resolver {
         region: Option<String>,
         profile: Option<String>,
         endpoint: Option<&str>,
-    ) -> Result<(Vec<u8>, Option<String>)> {
+    ) -> Result<Object> {
         // Get cached client (creates one if needed)
         let client: aws_sdk_s3::Client = client_cache::get_client(region, profile, endpoint).await;
 
@@ -189,26 +212,15 @@ impl Resolver for S3Resolver {
         let arg = &args[0];
 
         // Parse bucket/key format (first / separates bucket from key)
-        let parts: Vec<&str> = arg.splitn(2, '/').collect();
-        if parts.len() != 2 {
-            return Err(Error::resolver_custom(
-                "s3",
-                format!("S3 argument must be in bucket/key format: {}", arg),
-            ));
-        }
-
-        let bucket = parts[0];
-        let key = parts[1];
-
-        if bucket.is_empty() || key.is_empty() {
+        let Some((bucket, key)) = parse_bucket_key(arg) else {
             return Err(Error::resolver_custom(
                 "s3",
                 format!("S3 argument must be in bucket/key format: {}", arg),
             ));
-        }
+        };
 
         // Resolve configuration with precedence: kwargs > service config > global config
-        let (endpoint, region, profile) = crate::resolve_s3_config(
+        let client_key = crate::resolve_s3_config(
             kwargs.get("endpoint").map(|s| s.as_str()),
             kwargs.get("region").map(|s| s.as_str()),
             kwargs.get("profile").map(|s| s.as_str()),
@@ -216,14 +228,21 @@ impl Resolver for S3Resolver {
 
         let parse_kwarg = kwargs.get("parse").map(|s| s.as_str());
 
-        // Fetch the object as raw bytes using the async runtime
-        let (bytes, content_type) = self.runtime.block_on(self.fetch_object_bytes(
-            bucket,
-            key,
-            region,
-            profile,
-            endpoint.as_deref(),
-        ))?;
+        let object_key = (bucket.to_string(), key.to_string(), client_key);
+        let (bytes, content_type) = match PREFETCHED.take(&object_key) {
+            Some(object) => object,
+            None => {
+                // Fetch the object as raw bytes using the async runtime
+                let (_, _, (endpoint, region, profile)) = object_key;
+                runtime::block_on(self.fetch_object_bytes(
+                    bucket,
+                    key,
+                    region,
+                    profile,
+                    endpoint.as_deref(),
+                ))?
+            }
+        };
 
         // Determine parse mode and parse content
         let mode = self.determine_parse_mode(parse_kwarg, key, content_type.as_deref());
@@ -236,6 +255,80 @@ impl Resolver for S3Resolver {
     fn name(&self) -> &str {
         "s3"
     }
+
+    fn prefetch(&self, calls: &[ResolverCall]) {
+        let mut objects: HashSet<ObjectKey> = HashSet::new();
+        for call in calls {
+            // Invalid arguments error in resolve
+            let Some((bucket, key)) = call.args.first().and_then(|arg| parse_bucket_key(arg))
+            else {
+                continue;
+            };
+            let client_key = crate::resolve_s3_config(
+                call.kwargs.get("endpoint").map(|s| s.as_str()),
+                call.kwargs.get("region").map(|s| s.as_str()),
+                call.kwargs.get("profile").map(|s| s.as_str()),
+            );
+            objects.insert((bucket.to_string(), key.to_string(), client_key));
+        }
+
+        // A single object gains nothing over the GetObject call in resolve
+        if objects.len() < 2 {
+            return;
+        }
+
+        let fetched = runtime::block_on(fetch_objects(objects));
+        for (key, object) in fetched {
+            PREFETCHED.insert(key, object);
+        }
+    }
+}
+
+/// Fetch many objects concurrently.
+///
+/// At most `HOLOCONF_AWS_CONCURRENCY` (default 16) requests run at a time. Failed
+/// requests are left out of the result; `resolve` fetches those objects itself and
+/// reports the error there.
+async fn fetch_objects(objects: HashSet<ObjectKey>) -> Vec<(ObjectKey, Object)> {
+    let permits = Arc::new(Semaphore::new(*prefetch::CONCURRENCY));
+
+    let mut requests = JoinSet::new();
+    for object_key in objects {
+        let permits = Arc::clone(&permits);
+        requests.spawn(async move {
+            let _permit = permits.acquire_owned().await.ok()?;
+            let (bucket, key, (endpoint, region, profile)) = &object_key;
+            let client: aws_sdk_s3::Client =
+                client_cache::get_client(region.clone(), profile.clone(), endpoint.as_deref())
+                    .await;
+            let response = client
+                .get_object()
+                .bucket(bucket)
+                .key(key)
+                .send()
+                .await
+                .ok()?;
+
+            let content_type = response.content_type().map(|s| s.to_string());
+            let bytes = response.body.collect().await.ok()?;
+            Some((object_key, (bytes.into_bytes().to_vec(), content_type)))
+        });
+    }
+
+    let mut fetched = Vec::new();
+    while let Some(result) = requests.join_next().await {
+        if let Ok(Some(object)) = result {
+            fetched.push(object);
+        }
+    }
+    fetched
+}
+
+/// Discard prefetched objects.
+///
+/// Called by `reset()`.
+pub(crate) fn clear() {
+    PREFETCHED.clear();
 }
 
 /// Register the S3 resolver in the global registry.
@@ -249,6 +342,17 @@ pub fn register() {
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_parse_bucket_key() {
+        assert_eq!(
+            parse_bucket_key("bucket/configs/app.yaml"),
+            Some(("bucket", "configs/app.yaml"))
+        );
+        assert_eq!(parse_bucket_key("bucket"), None);
+        assert_eq!(parse_bucket_key("/key"), None);
+        assert_eq!(parse_bucket_key("bucket/"), None);
+    }
+
     #[test]
     fn test_s3_resolver_name() {
         let resolver = S3Resolver::new();
@@ -2,16 +2,171 @@
 //!
 //! Provides the `ssm` resolver for fetching values from AWS Systems Manager Parameter Store.
 
-use std::collections::HashMap;
-use std::sync::Arc;
+use std::collections::{HashMap, HashSet};
+use std::sync::{Arc, Mutex};
+use std::time::{Duration, Instant};
 
+use aws_sdk_ssm::operation::get_parameter::GetParameterError;
 use aws_sdk_ssm::types::ParameterType;
 use holoconf_core::error::{Error, Result};
-use holoconf_core::resolver::{register_global, ResolvedValue, Resolver, ResolverContext};
+use holoconf_core::resolver::{
+    register_global, ResolvedValue, Resolver, ResolverCall, ResolverContext,
+};
 use holoconf_core::Value;
-use tokio::runtime::Runtime;
+use once_cell::sync::Lazy;
+use tokio::sync::Semaphore;
+use tokio::task::JoinSet;
 
-use crate::client_cache;
+use crate::{client_cache, prefetch, runtime};
+
+/// Maximum number of names accepted by a single `GetParameters` request.
+const GET_PARAMETERS_MAX_NAMES: usize = 10;
+
+/// Page size used when listing a hierarchy with `GetParametersByPath` (the API maximum).
+const GET_PARAMETERS_BY_PATH_PAGE_SIZE: i32 = 10;
+
+/// Requested parameters that must share a parent path before `prefetch` lists it.
+const MIN_SIBLINGS: usize = 3;
+
+/// Client settings a parameter is fetched with: (endpoint, region, profile)
+type ClientKey = (Option<String>, Option<String>, Option<String>);
+
+/// A fetched parameter: (value, type)
+type Parameter = (String, ParameterType);
+
+/// Default lifetime of cached parameters.
+const DEFAULT_CACHE_TTL: Duration = Duration::from_secs(300);
+
+/// Longest lifetime of a cached miss: long enough to cover one config load (a
+/// prefetch followed by resolution), short enough that a parameter created after
+/// a failed lookup is seen on the next reload.
+const MISS_CACHE_TTL: Duration = Duration::from_secs(5);
+
+/// Cache key: (path, client settings)
+type ParameterKey = (String, ClientKey);
+
+/// A cached lookup: the resolved value, or `None` if SSM reported the parameter missing.
+type CachedParameter = Option<ResolvedValue>;
+
+/// Time-bounded cache of resolved parameters.
+///
+/// Entries hold the finished `ResolvedValue`, so a cache hit skips the type
+/// conversion (including `StringList` splitting) as well as the SSM call. Missing
+/// parameters are cached too, for at most [`MISS_CACHE_TTL`], so optional
+/// parameters with a `default` don't cost a round trip per reference within a load.
+struct ParameterCache {
+    entries: Mutex<HashMap<ParameterKey, (CachedParameter, Instant)>>,
+    ttl: Duration,
+    miss_ttl: Duration,
+}
+
+impl ParameterCache {
+    fn new(ttl: Duration) -> Self {
+        Self {
+            entries: Mutex::new(HashMap::new()),
+            ttl,
+            miss_ttl: ttl.min(MISS_CACHE_TTL),
+        }
+    }
+
+    /// Whether caching is enabled (a TTL of zero disables it).
+    fn is_enabled(&self) -> bool {
+        !self.ttl.is_zero()
+    }
+
+    /// Look up a parameter, evicting it if it has expired.
+    fn get(&self, key: &ParameterKey) -> Option<CachedParameter> {
+        let mut entries = self.entries.lock().unwrap();
+        let (cached, fetched_at) = entries.get(key)?;
+        let ttl = if cached.is_some() {
+            self.ttl
+        } else {
+            self.miss_ttl
+        };
+        if fetched_at.elapsed() < ttl {
+            return Some(cached.clone());
+        }
+        entries.remove(key);
+        None
+    }
+
+    /// Store a freshly resolved (or missing) parameter.
+    fn insert(&self, key: ParameterKey, cached: CachedParameter) {
+        if self.is_enabled() {
+            let mut entries = self.entries.lock().unwrap();
+            entries.insert(key, (cached, Instant::now()));
+        }
+    }
+
+    /// Remove all entries.
+    fn clear(&self) {
+        self.entries.lock().unwrap().clear();
+    }
+}
+
+/// Parameters fetched by `resolve` or `prefetch`, shared by all resolver instances
+/// so repeated loads of the same config skip the SSM round trip.
+///
+/// Entries live for `HOLOCONF_SSM_TTL` seconds (default 300, 0 disables caching).
+static PARAMETER_CACHE: Lazy<ParameterCache> = Lazy::new(|| {
+    let ttl = std::env::var("HOLOCONF_SSM_TTL")
+        .ok()
+        .and_then(|ttl| ttl.parse().ok())
+        .map(Duration::from_secs)
+        .unwrap_or(DEFAULT_CACHE_TTL);
+    ParameterCache::new(ttl)
+});
+
+/// Convert a fetched parameter to the value `resolve` returns.
+fn to_resolved_value((value, param_type): Parameter) -> ResolvedValue {
+    match param_type {
+        ParameterType::SecureString => {
+            // SecureString is automatically sensitive
+            ResolvedValue::sensitive(Value::String(value))
+        }
+        ParameterType::StringList => {
+            // StringList is comma-separated, convert to array
+            let values: Vec<Value> = value
+                .split(',')
+                .map(|s| Value::String(s.to_string()))
+                .collect();
+            ResolvedValue::new(Value::Sequence(values))
+        }
+        _ => {
+            // Regular string
+            ResolvedValue::new(Value::String(value))
+        }
+    }
+}
+
+/// Whether a `GetParameter` error means the parameter (or the version or label
+/// selected with `/path:N` or `/path:label`) doesn't exist.
+///
+/// Only these misses are cached; other failures are retried on the next resolution.
+fn is_missing_parameter(error: &GetParameterError) -> bool {
+    error.is_parameter_not_found() || error.is_parameter_version_not_found()
+}
+
+/// Check that an SSM parameter path is absolute (starts with `/`).
+fn is_valid_path(path: &str) -> bool {
+    path.as_bytes().first() == Some(&b'/')
+}
+
+/// Check that `path` is a valid SSM parameter path.
+///
+/// Parameter paths must be absolute (start with `/`). `resolve` applies this check
+/// before contacting SSM; it is public so other callers, such as the Python
+/// bindings, accept exactly the same paths.
+pub fn validate_ssm_path(path: &str) -> Result<()> {
+    if is_valid_path(path) {
+        Ok(())
+    } else {
+        Err(Error::resolver_custom(
+            "ssm",
+            format!("SSM parameter path must start with /: {}", path),
+        ))
+    }
+}
 
 /// SSM Parameter Store resolver.
 ///
@@ -37,36 +192,50 @@ use crate::client_cache;
 /// - `profile`: Use a specific AWS profile
 /// - `default`: Value to use if parameter not found (framework-handled)
 /// - `sensitive`: Override automatic sensitivity detection (framework-handled)
-pub struct SsmResolver {
-    runtime: Runtime,
-}
+///
+/// ## Caching
+///
+/// Fetched parameters are cached for `HOLOCONF_SSM_TTL` seconds (default 300, `0`
+/// disables caching); parameters found missing are remembered for at most 5
+/// seconds. Use `holoconf_aws::reset()` to clear the cache.
+pub struct SsmResolver;
 
 impl SsmResolver {
     /// Create a new SSM resolver.
     pub fn new() -> Self {
-        let runtime = Runtime::new().expect("Failed to create Tokio runtime");
-        Self { runtime }
+        Self
     }
 
-    /// Fetch a parameter from SSM.
+    /// Fetch a parameter from SSM, or `None` if it doesn't exist.
     async fn fetch_parameter(
         &self,
         path: &str,
         region: Option<String>,
         profile: Option<String>,
         endpoint: Option<&str>,
-    ) -> Result<(String, ParameterType)> {
+    ) -> Result<Option<Parameter>> {
         // Get cached client (creates one if needed)
         let client: aws_sdk_ssm::Client = client_cache::get_client(region, profile, endpoint).await;
 
         // Get parameter with decryption
-        let response = client
+        let result = client
             .get_parameter()
             .name(path)
             .with_decryption(true)
             .send()
-            .await
-            .map_err(|e| Error::not_found(format!("SSM parameter '{}': {}", path, e), None))?;
+            .await;
+        let response = match result {
+            Ok(response) => response,
+            Err(e) if e.as_service_error().is_some_and(is_missing_parameter) => {
+                return Ok(None);
+            }
+            Err(e) => {
+                return Err(Error::not_found(
+                    format!("SSM parameter '{}': {}", path, e),
+                    None,
+                ));
+            }
+        };
 
         let parameter = response
             .parameter()
@@ -81,8 +250,133 @@ impl SsmResolver {
 
         let param_type = parameter.r#type().cloned().unwrap_or(ParameterType::String);
 
-        Ok((value, param_type))
+        Ok(Some((value, param_type)))
     }
+
+    /// Fetch many parameters with `GetParameters`, up to 10 names per request.
+    ///
+    /// Requests run concurrently, at most `HOLOCONF_AWS_CONCURRENCY` (default 16) at a
+    /// time. Each requested path comes back with its parameter, or `None` if SSM
+    /// reported it missing. Paths from failed requests are left out of the result;
+    /// `resolve` falls back to `GetParameter` for those and reports the error there.
+    async fn fetch_parameters(
+        &self,
+        paths: &[String],
+        region: Option<String>,
+        profile: Option<String>,
+        endpoint: Option<&str>,
+    ) -> Vec<(String, Option<Parameter>)> {
+        let client: aws_sdk_ssm::Client = client_cache::get_client(region, profile, endpoint).await;
+        let permits = Arc::new(Semaphore::new(*prefetch::CONCURRENCY));
+
+        let mut requests = JoinSet::new();
+        for chunk in paths.chunks(GET_PARAMETERS_MAX_NAMES) {
+            let client = client.clone();
+            let names = chunk.to_vec();
+            let permits = Arc::clone(&permits);
+            requests.spawn(async move {
+                let _permit = permits.acquire_owned().await.ok()?;
+                client
+                    .get_parameters()
+                    .set_names(Some(names))
+                    .with_decryption(true)
+                    .send()
+                    .await
+                    .ok()
+            });
+        }
+
+        let mut fetched = Vec::with_capacity(paths.len());
+        while let Some(result) = requests.join_next().await {
+            let Ok(Some(response)) = result else {
+                continue;
+            };
+
+            for parameter in response.parameters() {
+                if let (Some(name), Some(value)) = (parameter.name(), parameter.value()) {
+                    let param_type = parameter.r#type().cloned().unwrap_or(ParameterType::String);
+                    fetched.push((name.to_string(), Some((value.to_string(), param_type))));
+                }
+            }
+            for name in response.invalid_parameters() {
+                fetched.push((name.clone(), None));
+            }
+        }
+
+        fetched
+    }
+
+    /// List the given parent paths with `GetParametersByPath`, one page each.
+    ///
+    /// Every parameter directly under a parent is returned, including ones that weren't
+    /// requested, so they're cached if referenced later. Only the first page is read:
+    /// a larger hierarchy would cost more calls than `GetParameters`, so any requested
+    /// paths not seen are left to `fetch_parameters`. Failed requests (for example,
+    /// without `ssm:GetParametersByPath` permission) are skipped the same way.
+    async fn fetch_hierarchies(
+        &self,
+        parents: Vec<String>,
+        region: Option<String>,
+        profile: Option<String>,
+        endpoint: Option<&str>,
+    ) -> Vec<(String, Option<Parameter>)> {
+        let client: aws_sdk_ssm::Client = client_cache::get_client(region, profile, endpoint).await;
+        let permits = Arc::new(Semaphore::new(*prefetch::CONCURRENCY));
+
+        let mut requests = JoinSet::new();
+        for parent in parents {
+            let client = client.clone();
+            let permits = Arc::clone(&permits);
+            requests.spawn(async move {
+                let _permit = permits.acquire_owned().await.ok()?;
+                client
+                    .get_parameters_by_path()
+                    .path(parent)
+                    .recursive(false)
+                    .with_decryption(true)
+                    .max_results(GET_PARAMETERS_BY_PATH_PAGE_SIZE)
+                    .send()
+                    .await
+                    .ok()
+            });
+        }
+
+        let mut fetched = Vec::new();
+        while let Some(result) = requests.join_next().await {
+            let Ok(Some(response)) = result else {
+                continue;
+            };
+
+            for parameter in response.parameters() {
+                if let (Some(name), Some(value)) = (parameter.name(), parameter.value()) {
+                    let param_type = parameter.r#type().cloned().unwrap_or(ParameterType::String);
+                    fetched.push((name.to_string(), Some((value.to_string(), param_type))));
+                }
+            }
+        }
+
+        fetched
+    }
+}
+
+/// Group paths by their parent, keeping parents with at least [`MIN_SIBLINGS`] children.
+///
+/// Top-level parameters (`/name`) are never grouped: listing `/` could return the
+/// whole account.
+fn sibling_groups(paths: &[String]) -> Vec<String> {
+    let mut counts: HashMap<&str, usize> = HashMap::new();
+    for path in paths {
+        if let Some((parent, _)) = path.rsplit_once('/') {
+            if !parent.is_empty() {
+                *counts.entry(parent).or_default() += 1;
+            }
+        }
+    }
+    counts
+        .into_iter()
+        .filter(|(_, count)| *count >= MIN_SIBLINGS)
+        .map(|(parent, _)| parent.to_string())
+        .collect()
 }
 
 impl Default for SsmResolver {
@@ -109,12 +403,7 @@ impl Resolver for SsmResolver {
         let path = &args[0];
 
         // SSM paths must start with /
-        if !path.starts_with('/') {
-            return Err(Error::resolver_custom(
-                "ssm",
-                format!("SSM parameter path must start with /: {}", path),
-            ));
-        }
+        validate_ssm_path(path)?;
 
         // Resolve configuration with precedence: kwargs > service config > global config
         let (endpoint, region, profile) = crate::resolve_ssm_config(
@@ -123,38 +412,112 @@ impl Resolver for SsmResolver {
             kwargs.get("profile").map(|s| s.as_str()),
         );
 
-        // Fetch the parameter using the async runtime
-        let (value, param_type) = self.runtime.block_on(self.fetch_parameter(
-            path,
-            region,
-            profile,
-            endpoint.as_deref(),
-        ))?;
-
-        // Handle different parameter types
-        match param_type {
-            ParameterType::SecureString => {
-                // SecureString is automatically sensitive
-                Ok(ResolvedValue::sensitive(Value::String(value)))
-            }
-            ParameterType::StringList => {
-                // StringList is comma-separated, convert to array
-                let values: Vec<Value> = value
-                    .split(',')
-                    .map(|s| Value::String(s.to_string()))
-                    .collect();
-                Ok(ResolvedValue::new(Value::Sequence(values)))
+        // Use the cached parameter if there is one, otherwise fetch and cache it
+        let key = (path.clone(), (endpoint, region, profile));
+        let cached = match PARAMETER_CACHE.get(&key) {
+            Some(cached) => cached,
+            None => {
+                let (_, (endpoint, region, profile)) = &key;
+                let parameter = runtime::block_on(self.fetch_parameter(
+                    path,
+                    region.clone(),
+                    profile.clone(),
+                    endpoint.as_deref(),
+                ))?;
+                let cached = parameter.map(to_resolved_value);
+                PARAMETER_CACHE.insert(key, cached.clone());
+                cached
             }
-            _ => {
-                // Regular string
-                Ok(ResolvedValue::new(Value::String(value)))
-            }
-        }
+        };
+
+        cached.ok_or_else(|| Error::not_found(format!("SSM parameter '{}' not found", path), None))
     }
 
     fn name(&self) -> &str {
         "ssm"
     }
+
+    /// Fetch all literal `${ssm:...}` paths with batched `GetParameters` calls.
+    ///
+    /// When several paths share a parent, the parent is listed with
+    /// `GetParametersByPath` first (see `fetch_hierarchies`).
+    fn prefetch(&self, calls: &[ResolverCall]) {
+        // Prefetched values are handed to resolve() through the cache
+        if !PARAMETER_CACHE.is_enabled() {
+            return;
+        }
+
+        // Group paths by the client that would fetch them
+        let mut groups: HashMap<ClientKey, HashSet<String>> = HashMap::new();
+        for call in calls {
+            let Some(path) = call.args.first() else {
+                continue;
+            };
+            // Invalid paths error in resolve; version/label selectors aren't batched
+            if !is_valid_path(path) || path.contains(':') {
+                continue;
+            }
+            let client_key = crate::resolve_ssm_config(
+                call.kwargs.get("endpoint").map(|s| s.as_str()),
+                call.kwargs.get("region").map(|s| s.as_str()),
+                call.kwargs.get("profile").map(|s| s.as_str()),
+            );
+            let key = (path.clone(), client_key);
+            if PARAMETER_CACHE.get(&key).is_some() {
+                continue;
+            }
+            let (path, client_key) = key;
+            groups.entry(client_key).or_default().insert(path);
+        }
+
+        for (client_key, paths) in groups {
+            // A single path gains nothing over the GetParameter call in resolve
+            if paths.len() < 2 {
+                continue;
+            }
+            let paths: Vec<String> = paths.into_iter().collect();
+            let (endpoint, region, profile) = &client_key;
+
+            let parents = sibling_groups(&paths);
+            let mut fetched = if parents.is_empty() {
+                Vec::new()
+            } else {
+                runtime::block_on(self.fetch_hierarchies(
+                    parents,
+                    region.clone(),
+                    profile.clone(),
+                    endpoint.as_deref(),
+                ))
+            };
+
+            // Batch whatever the hierarchy listings didn't cover
+            let listed: HashSet<&str> = fetched.iter().map(|(path, _)| path.as_str()).collect();
+            let remaining: Vec<String> = paths
+                .into_iter()
+                .filter(|path| !listed.contains(path.as_str()))
+                .collect();
+            if !remaining.is_empty() {
+                fetched.extend(runtime::block_on(self.fetch_parameters(
+                    &remaining,
+                    region.clone(),
+                    profile.clone(),
+                    endpoint.as_deref(),
+                )));
+            }
+
+            for (path, parameter) in fetched {
+                let cached = parameter.map(to_resolved_value);
+                PARAMETER_CACHE.insert((path, client_key.clone()), cached);
+            }
+        }
+    }
+}
+
+/// Clear the parameter cache.
+///
+/// Called by `reset()`.
+pub(crate) fn clear() {
+    PARAMETER_CACHE.clear();
 }
 
 /// Register the SSM resolver in the global registry.
@@ -162,6 +525,18 @@ pub fn register() {
     let resolver = Arc::new(SsmResolver::new());
     // Use force=true to allow re-registration (e.g., during testing)
     let _ = register_global(resolver, true);
+    prewarm();
+}
+
+/// Load the default SSM client on a background thread if `HOLOCONF_AWS_PREWARM=1`.
+///
+/// Called when the resolver is registered, so AWS config loading overlaps with
+/// the rest of startup instead of delaying the first lookup.
+pub fn prewarm() {
+    if std::env::var("HOLOCONF_AWS_PREWARM").is_ok_and(|v| v == "1") {
+        let (endpoint, region, profile) = crate::resolve_ssm_config(None, None, None);
+        client_cache::prewarm::<aws_sdk_ssm::Client>(region, profile, endpoint);
+    }
 }
 
 #[cfg(test)]
@@ -201,6 +576,199 @@ mod tests {
             .contains("must start with /"));
     }
 
+    #[test]
+    fn test_ssm_resolver_empty_path() {
+        let resolver = SsmResolver::new();
+        let ctx = ResolverContext::new("test.path");
+        let args = vec![String::new()];
+
+        let result = resolver.resolve(&args, &HashMap::new(), &ctx);
+        assert!(result.is_err());
+        assert!(result
+            .unwrap_err()
+            .to_string()
+            .contains("must start with /"));
+    }
+
+    #[test]
+    fn test_ssm_prefetch_skips_unbatchable_calls() {
+        let resolver = SsmResolver::new();
+        let call = |path: &str| ResolverCall {
+            args: vec![path.to_string()],
+            kwargs: HashMap::new(),
+        };
+
+        // Invalid paths, selectors and lone paths never reach the network
+        resolver.prefetch(&[
+            call("invalid-path"),
+            call("/app/versioned:3"),
+            call("/app/single"),
+            ResolverCall {
+                args: vec![],
+                kwargs: HashMap::new(),
+            },
+        ]);
+    }
+
+    fn cache_key(path: &str) -> ParameterKey {
+        (
+            path.to_string(),
+            (None, Some("us-east-1".to_string()), None),
+        )
+    }
+
+    #[test]
+    fn test_parameter_cache_hit() {
+        let cache = ParameterCache::new(Duration::from_secs(60));
+        cache.insert(
+            cache_key("/app/host"),
+            Some(ResolvedValue::new(Value::String("db.internal".to_string()))),
+        );
+
+        let resolved = cache.get(&cache_key("/app/host")).unwrap().unwrap();
+        assert_eq!(resolved.value.as_str(), Some("db.internal"));
+        assert!(cache.get(&cache_key("/app/port")).is_none());
+
+        cache.clear();
+        assert!(cache.get(&cache_key("/app/host")).is_none());
+    }
+
+    #[test]
+    fn test_parameter_cache_remembers_missing() {
+        let cache = ParameterCache::new(Duration::from_secs(60));
+        cache.insert(cache_key("/app/optional"), None);
+
+        // A cached miss is distinct from no entry at all
+        assert!(matches!(cache.get(&cache_key("/app/optional")), Some(None)));
+        assert!(cache.get(&cache_key("/app/other")).is_none());
+    }
+
+    #[test]
+    fn test_parameter_cache_misses_expire_first() {
+        let cache = ParameterCache {
+            entries: Mutex::new(HashMap::new()),
+            ttl: Duration::from_secs(60),
+            miss_ttl: Duration::from_millis(1),
+        };
+        cache.insert(
+            cache_key("/app/host"),
+            Some(ResolvedValue::new(Value::String("db.internal".to_string()))),
+        );
+        cache.insert(cache_key("/app/optional"), None);
+        std::thread::sleep(Duration::from_millis(5));
+
+        // A parameter created after the miss is fetched again
+        assert!(cache.get(&cache_key("/app/optional")).is_none());
+        assert!(cache.get(&cache_key("/app/host")).is_some());
+    }
+
+    #[test]
+    fn test_parameter_cache_miss_ttl_is_capped() {
+        assert_eq!(
+            ParameterCache::new(Duration::from_secs(300)).miss_ttl,
+            MISS_CACHE_TTL
+        );
+        assert_eq!(
+            ParameterCache::new(Duration::from_secs(1)).miss_ttl,
+            Duration::from_secs(1)
+        );
+    }
+
+    #[test]
+    fn test_parameter_cache_expires() {
+        let cache = ParameterCache::new(Duration::from_millis(1));
+        cache.insert(
+            cache_key("/app/host"),
+            Some(ResolvedValue::new(Value::String("db.internal".to_string()))),
+        );
+        std::thread::sleep(Duration::from_millis(5));
+
+        assert!(cache.get(&cache_key("/app/host")).is_none());
+    }
+
+    #[test]
+    fn test_parameter_cache_disabled() {
+        let cache = ParameterCache::new(Duration::ZERO);
+        cache.insert(
+            cache_key("/app/host"),
+            Some(ResolvedValue::new(Value::String("db.internal".to_string()))),
+        );
+
+        assert!(!cache.is_enabled());
+        assert!(cache.get(&cache_key("/app/host")).is_none());
+    }
+
+    #[test]
+    fn test_sibling_groups() {
+        let paths: Vec<String> = [
+            "/app/prod/db-host",
+            "/app/prod/db-port",
+            "/app/prod/db-password",
+            "/app/prod/cache/host",
+            "/app/staging/db-host",
+            "/top-a",
+            "/top-b",
+            "/top-c",
+        ]
+        .iter()
+        .map(|s| s.to_string())
+        .collect();
+
+        assert_eq!(sibling_groups(&paths), vec!["/app/prod".to_string()]);
+    }
+
+    #[test]
+    fn test_validate_ssm_path() {
+        assert!(validate_ssm_path("/app/db-host").is_ok());
+        assert!(validate_ssm_path("/").is_ok());
+
+        let err = validate_ssm_path("app/db-host").unwrap_err();
+        assert!(err.to_string().contains("must start with /"));
+        assert!(validate_ssm_path("").is_err());
+    }
+
+    #[test]
+    fn test_is_missing_parameter() {
+        use aws_sdk_ssm::types::error::{
+            InternalServerError, InvalidKeyId, ParameterNotFound, ParameterVersionNotFound,
+        };
+
+        // A missing parameter, version or label is a cacheable miss
+        assert!(is_missing_parameter(&GetParameterError::ParameterNotFound(
+            ParameterNotFound::builder().build()
+        )));
+        assert!(is_missing_parameter(
+            &GetParameterError::ParameterVersionNotFound(
+                ParameterVersionNotFound::builder().build()
+            )
+        ));
+
+        // Anything else is retried on the next resolution
+        assert!(!is_missing_parameter(
+            &GetParameterError::InternalServerError(InternalServerError::builder().build())
+        ));
+        assert!(!is_missing_parameter(&GetParameterError::InvalidKeyId(
+            InvalidKeyId::builder().build()
+        )));
+    }
+
+    #[test]
+    fn test_to_resolved_value() {
+        let secure = to_resolved_value(("hunter2".to_string(), ParameterType::SecureString));
+        assert!(secure.sensitive);
+        assert_eq!(secure.value.as_str(), Some("hunter2"));
+
+        let list = to_resolved_value(("a,b".to_string(), ParameterType::StringList));
+        assert!(!list.sensitive);
+        assert_eq!(
+            list.value,
+            Value::Sequence(vec![
+                Value::String("a".to_string()),
+                Value::String("b".to_string()),
+            ])
+        );
+    }
+
     #[test]
     fn test_register_doesnt_panic() {
         // Just verify registration doesn't panic
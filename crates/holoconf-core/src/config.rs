@@ -9,7 +9,9 @@ use std::sync::{Arc, RwLock};
 
 use crate::error::{Error, Result};
 use crate::interpolation::{self, Interpolation, InterpolationArg};
-use crate::resolver::{global_registry, ResolvedValue, ResolverContext, ResolverRegistry};
+use crate::resolver::{
+    global_registry, ResolvedValue, ResolverCall, ResolverContext, ResolverRegistry,
+};
 use crate::value::Value;
 
 /// Maximum depth for nested interpolation resolution to prevent stack overflow
@@ -30,6 +32,85 @@ fn expand_glob(pattern: &str) -> Result<Vec<PathBuf>> {
     Ok(paths)
 }
 
+/// Collect resolver calls with literal arguments from a raw value tree
+///
+/// Used to give resolvers a chance to batch lookups before an eager resolution
+/// pass. Values that fail to parse are skipped; resolution reports those errors.
+fn collect_resolver_calls(value: &Value, calls: &mut HashMap<String, Vec<ResolverCall>>) {
+    match value {
+        Value::String(s) => {
+            if interpolation::needs_processing(s) {
+                if let Ok(parsed) = interpolation::parse(s) {
+                    collect_interpolation_calls(&parsed, calls);
+                }
+            }
+        }
+        Value::Sequence(seq) => {
+            for item in seq {
+                collect_resolver_calls(item, calls);
+            }
+        }
+        Value::Mapping(map) => {
+            for val in map.values() {
+                collect_resolver_calls(val, calls);
+            }
+        }
+        _ => {}
+    }
+}
+
+/// Collect resolver calls from a parsed interpolation (see `collect_resolver_calls`)
+fn collect_interpolation_calls(
+    interp: &Interpolation,
+    calls: &mut HashMap<String, Vec<ResolverCall>>,
+) {
+    match interp {
+        Interpolation::Resolver { name, args, kwargs } => {
+            // Nested interpolations are resolved first, so collect them too.
+            // Defaults are resolved lazily and only on a miss, so skip them.
+            let nested_args = args.iter().chain(
+                kwargs
+                    .iter()
+                    .filter(|(k, _)| *k != "default")
+                    .map(|(_, v)| v),
+            );
+            for arg in nested_args {
+                if let InterpolationArg::Nested(nested) = arg {
+                    collect_interpolation_calls(nested, calls);
+                }
+            }
+
+            // Config references are handled by the framework, not a resolver
+            if name == "ref" {
+                return;
+            }
+
+            let literal_args: Option<Vec<String>> = args
+                .iter()
+                .map(|arg| arg.as_literal().map(String::from))
+                .collect();
+            let literal_kwargs: Option<HashMap<String, String>> = kwargs
+                .iter()
+                .filter(|(k, _)| *k != "default" && *k != "sensitive")
+                .map(|(k, v)| v.as_literal().map(|v| (k.clone(), v.to_string())))
+                .collect();
+
+            if let (Some(args), Some(kwargs)) = (literal_args, literal_kwargs) {
+                calls
+                    .entry(name.clone())
+                    .or_default()
+                    .push(ResolverCall { args, kwargs });
+            }
+        }
+        Interpolation::Concat(parts) => {
+            for part in parts {
+                collect_interpolation_calls(part, calls);
+            }
+        }
+        Interpolation::Literal(_) | Interpolation::SelfRef { .. } => {}
+    }
+}
+
 /// Configuration options for loading configs
 #[derive(Debug, Clone, Default)]
 pub struct ConfigOptions {
@@ -583,6 +664,7 @@ impl Config {
 
     /// Resolve all values in the configuration eagerly
     pub fn resolve_all(&self) -> Result<()> {
+        self.prefetch_resolvers();
         let mut resolution_stack = Vec::new();
         self.resolve_value_recursive(&self.raw, "", &mut resolution_stack)?;
         Ok(())
@@ -609,6 +691,7 @@ impl Config {
         if !resolve {
             return Ok((*self.raw).clone());
         }
+        self.prefetch_resolvers();
         let mut resolution_stack = Vec::new();
         if redact {
             self.resolve_value_to_value_redacted(&self.raw, "", &mut resolution_stack)
@@ -740,6 +823,17 @@ impl Config {
         }
     }
 
+    /// Let resolvers batch their lookups before an eager resolution pass
+    fn prefetch_resolvers(&self) {
+        let mut calls = HashMap::new();
+        collect_resolver_calls(&self.raw, &mut calls);
+        for (name, resolver_calls) in &calls {
+            if let Some(resolver) = self.resolvers.get(name) {
+                resolver.prefetch(resolver_calls);
+            }
+        }
+    }
+
     /// Helper to resolve which schema to use (provided or attached)
     fn resolve_schema<'a>(
         &'a self,
@@ -2236,6 +2330,72 @@ invalid: ${env:HOLOCONF_NONEXISTENT_RESOLVE_VAR}
         assert!(result.unwrap_err().to_string().contains("not found"));
     }
 
+    #[test]
+    fn test_resolve_all_prefetches_literal_calls() {
+        use crate::resolver::Resolver;
+        use std::sync::Mutex;
+
+        struct RecordingResolver {
+            prefetched: Mutex<Vec<ResolverCall>>,
+        }
+
+        impl Resolver for RecordingResolver {
+            fn resolve(
+                &self,
+                args: &[String],
+                _kwargs: &HashMap<String, String>,
+                _ctx: &ResolverContext,
+            ) -> Result<ResolvedValue> {
+                Ok(ResolvedValue::new(Value::String(args.join(","))))
+            }
+
+            fn name(&self) -> &str {
+                "rec"
+            }
+
+            fn prefetch(&self, calls: &[ResolverCall]) {
+                self.prefetched.lock().unwrap().extend_from_slice(calls);
+            }
+        }
+
+        let resolver = Arc::new(RecordingResolver {
+            prefetched: Mutex::new(Vec::new()),
+        });
+        let mut registry = ResolverRegistry::with_builtins();
+        registry.register(Arc::clone(&resolver));
+
+        std::env::remove_var("HOLOCONF_PREFETCH_TEST_VAR");
+        let yaml = r#"
+a: ${rec:one}
+b: prefix-${rec:two,region=x,sensitive=true}
+c: ${rec:${env:HOLOCONF_PREFETCH_TEST_VAR,default=three}}
+d: ${rec:four,default=${rec:five}}
+"#;
+        let value: Value = serde_yaml::from_str(yaml).unwrap();
+        let config = Config::with_resolvers(value, registry);
+        config.resolve_all().unwrap();
+
+        // Only literal calls are prefetched; framework kwargs and lazy defaults are skipped
+        let mut region = HashMap::new();
+        region.insert("region".to_string(), "x".to_string());
+        let expected = vec![
+            ResolverCall {
+                args: vec!["one".to_string()],
+                kwargs: HashMap::new(),
+            },
+            ResolverCall {
+                args: vec!["two".to_string()],
+                kwargs: region,
+            },
+            ResolverCall {
+                args: vec!["four".to_string()],
+                kwargs: HashMap::new(),
+            },
+        ];
+        assert_eq!(*resolver.prefetched.lock().unwrap(), expected);
+        assert_eq!(config.get("c").unwrap().as_str(), Some("three"));
+    }
+
     #[test]
     fn test_self_reference_basic() {
         // Test basic self-references (without default kwargs - kwargs not yet implemented for self-ref)
@@ -35,6 +35,6 @@ mod config;
 
 pub use config::{Config, ConfigOptions};
 pub use error::{Error, Result};
-pub use resolver::{ResolvedValue, Resolver, ResolverRegistry};
+pub use resolver::{ResolvedValue, Resolver, ResolverCall, ResolverRegistry};
 pub use schema::Schema;
 pub use value::Value;
@@ -321,6 +321,29 @@ pub trait Resolver: Send + Sync {
 
     /// Get the name of this resolver
     fn name(&self) -> &str;
+
+    /// Prepare for a batch of upcoming resolutions
+    ///
+    /// Called once per eager resolution pass (`resolve_all`, `to_value`) with every
+    /// call to this resolver whose arguments are plain literals. Resolvers backed by
+    /// remote services can override this to fetch values in bulk and answer the
+    /// following `resolve` calls from a cache.
+    ///
+    /// This is best-effort: failures should be ignored here and reported by
+    /// `resolve` for the individual calls. The default implementation does nothing.
+    fn prefetch(&self, _calls: &[ResolverCall]) {}
+}
+
+/// A resolver call collected ahead of resolution (see [`Resolver::prefetch`])
+///
+/// Framework-level kwargs (`default`, `sensitive`) are not included, matching what
+/// `resolve` receives.
+#[derive(Debug, Clone, PartialEq)]
+pub struct ResolverCall {
+    /// Positional arguments
+    pub args: Vec<String>,
+    /// Keyword arguments
+    pub kwargs: HashMap<String, String>,
 }
 
 /// A simple function-based resolver
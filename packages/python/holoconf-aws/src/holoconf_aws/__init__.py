@@ -88,6 +88,7 @@ from holoconf_aws._holoconf_aws import (
     reset,
     s3,
     ssm,
+    validate_ssm_path,
 )
 
 __all__ = [
@@ -100,4 +101,5 @@ __all__ = [
     "reset",
     "s3",
     "ssm",
+    "validate_ssm_path",
 ]
@@ -132,11 +132,29 @@ def cfn(
     """
     ...
 
+def validate_ssm_path(path: str) -> None:
+    """Check that a path is a valid SSM parameter path.
+
+    Applies the same rule as the `ssm` resolver: parameter paths must be absolute
+    (start with `/`).
+
+    Args:
+        path: The parameter path to check
+
+    Raises:
+        ValueError: If the path is not a valid SSM parameter path
+
+    Example:
+        >>> import holoconf_aws
+        >>> holoconf_aws.validate_ssm_path("/app/prod/db-password")
+    """
+    ...
+
 def reset() -> None:
     """Reset all configuration and clear the client cache.
 
-    Clears all global and service-specific configuration, and removes all cached AWS clients.
-    Useful for test isolation.
+    Clears all global and service-specific configuration, and removes all cached AWS clients
+    and SSM parameters. Useful for test isolation.
 
     Example:
         >>> import holoconf_aws
@@ -1,6 +1,8 @@
-"""Tests for SSM resolver registration."""
+"""Tests for SSM resolver registration and path validation."""
 
-from holoconf_aws import register_all, register_ssm
+import pytest
+
+from holoconf_aws import register_all, register_ssm, validate_ssm_path
 
 
 class TestRegistration:
@@ -27,3 +29,18 @@ class TestRegistration:
         """Test that force=True allows re-registration."""
         # Should not raise
         register_all(force=True)
+
+
+class TestValidateSsmPath:
+    """Tests for validate_ssm_path."""
+
+    def test_absolute_path_is_valid(self):
+        """Test that paths starting with / are accepted."""
+        # Should not raise
+        validate_ssm_path("/app/prod/db-password")
+
+    @pytest.mark.parametrize("path", ["app/prod/db-password", ""])
+    def test_relative_path_is_rejected(self, path):
+        """Test that paths not starting with / raise ValueError."""
+        with pytest.raises(ValueError, match="must start with /"):
+            validate_ssm_path(path)
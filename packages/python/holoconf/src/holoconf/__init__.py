@@ -27,11 +27,14 @@ Plugin Discovery:
         [project.entry-points."holoconf.resolvers"]
         ssm = "holoconf_aws:register_ssm"
 
-    The discover_plugins() function can be called manually to re-discover plugins.
+    The discover_plugins() function returns the plugins loaded so far; call it
+    with force=True to re-discover plugins installed at runtime.
 """
 
 import logging
 import sys
+from importlib.metadata import entry_points
+from typing import List, Optional
 
 from holoconf._holoconf import (
     CircularReferenceError,
@@ -52,16 +55,34 @@ from holoconf._holoconf import (
 
 _logger = logging.getLogger(__name__)
 
+# Names loaded by the last discovery pass, or None before the first one
+_discovered: Optional[List[str]] = None
 
-def discover_plugins() -> list[str]:
+# Pick the entry_points() API shape once, at import time
+if sys.version_info >= (3, 10):
+
+    def _resolver_entry_points():
+        return entry_points(group="holoconf.resolvers")
+
+else:
+
+    def _resolver_entry_points():
+        return entry_points().get("holoconf.resolvers", [])
+
+
+def discover_plugins(force: bool = False) -> List[str]:
     """Discover and load resolver plugins via entry points.
 
     This function discovers all installed packages that provide resolver plugins
     via the "holoconf.resolvers" entry point group, and calls their registration
     functions.
 
-    This is called automatically when holoconf is imported. You can call it
-    manually to re-discover plugins if new ones are installed at runtime.
+    This is called automatically when holoconf is imported. Later calls return
+    the plugins found by that first pass without scanning installed packages
+    again; pass force=True to re-discover plugins installed at runtime.
+
+    Args:
+        force: Scan entry points again even if discovery already ran.
 
     Returns:
         A list of successfully loaded plugin names.
@@ -78,20 +99,12 @@ def discover_plugins() -> list[str]:
         [project.entry-points."holoconf.resolvers"]
         ssm = "holoconf_aws:register_ssm"
     """
-    loaded = []
-
-    # Use importlib.metadata for Python 3.9+
-    if sys.version_info >= (3, 10):
-        from importlib.metadata import entry_points
-
-        eps = entry_points(group="holoconf.resolvers")
-    else:
-        from importlib.metadata import entry_points
+    global _discovered
+    if _discovered is not None and not force:
+        return list(_discovered)
 
-        all_eps = entry_points()
-        eps = all_eps.get("holoconf.resolvers", [])
-
-    for ep in eps:
+    loaded = []
+    for ep in _resolver_entry_points():
         try:
             register_func = ep.load()
             register_func()
@@ -104,7 +117,8 @@ def discover_plugins() -> list[str]:
                 e,
             )
 
-    return loaded
+    _discovered = loaded
+    return list(loaded)
 
 
 # Auto-discover plugins on import
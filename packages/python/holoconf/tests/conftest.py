@@ -0,0 +1,20 @@
+"""
+Shared fixtures for the Python binding tests.
+"""
+
+import pytest
+
+import holoconf
+
+
+# Instances are only inspected, never mutated, so one per session is enough
+@pytest.fixture(scope="session")
+def config_instance():
+    """Create a Config instance for testing instance methods."""
+    return holoconf.Config.loads("key: value")
+
+
+@pytest.fixture(scope="session")
+def schema_instance():
+    """Create a Schema instance for testing instance methods."""
+    return holoconf.Schema.from_yaml("type: object")
@@ -8,8 +8,10 @@ When adding new features to holoconf-core, add them to parity.yaml first -
 these tests will automatically fail until the Python bindings are updated.
 
 Run with: pytest tests/test_api_parity.py -v
+In parallel (pytest-xdist): pytest tests/test_api_parity.py -n auto --dist loadgroup
 """
 
+import functools
 import inspect
 from pathlib import Path
 
@@ -26,8 +28,16 @@ SPEC_PATH = (
     / "api"
     / "parity.yaml"
 )
+# Prefer libyaml's C loader when PyYAML was built with it (both loaders are safe)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 with open(SPEC_PATH) as f:
-    PARITY_SPEC = yaml.safe_load(f)
+    PARITY_SPEC = yaml.load(f, Loader=_YAML_LOADER)  # noqa: S506
+
+
+@functools.lru_cache(maxsize=None)
+def _sig_params(method):
+    """Names of a method's parameters, computed once per method object."""
+    return frozenset(inspect.signature(method).parameters)
 
 
 # =============================================================================
@@ -72,91 +82,64 @@ class TestExceptionHierarchy:
 # Class/Method Tests (generated from spec)
 # =============================================================================
 
+# Class specs and names, in spec order
+_CLASS_ITEMS = tuple(PARITY_SPEC["classes"].items())
+_CLASS_NAMES = tuple(name for name, _ in _CLASS_ITEMS)
+
+# Classes named in the spec, looked up once (None if not exported)
+_CLASSES = {name: getattr(holoconf, name, None) for name in _CLASS_NAMES}
+
 
 @pytest.mark.parametrize(
     "class_name",
-    list(PARITY_SPEC["classes"].keys()),
+    _CLASS_NAMES,
 )
 def test_class_exported(class_name):
     """Class is exported from holoconf module."""
-    assert hasattr(holoconf, class_name), f"{class_name} not exported"
-
-
-# Generate static method test cases
-_static_method_cases = [
-    (class_name, method)
-    for class_name, class_spec in PARITY_SPEC["classes"].items()
-    for method in class_spec.get("static_methods", [])
-]
-
-
-@pytest.mark.parametrize(
-    "class_name,method_spec",
-    _static_method_cases,
-    ids=[f"{c}.{m['name']}" for c, m in _static_method_cases],
-)
-def test_static_method_exists(class_name, method_spec):
-    """Static method exists on the class."""
-    cls = getattr(holoconf, class_name)
-    method_name = method_spec["name"]
-    assert hasattr(cls, method_name), f"{class_name}.{method_name} not found"
-    assert callable(getattr(cls, method_name))
+    assert _CLASSES[class_name] is not None, f"{class_name} not exported"
 
 
-# Generate static method parameter test cases
-_static_method_param_cases = [
-    (class_name, method)
-    for class_name, class_spec in PARITY_SPEC["classes"].items()
-    for method in class_spec.get("static_methods", [])
-    if method.get("parameters")
-]
+# Generate method test cases (and their ids) in a single pass over the spec.
+# Cases are grouped by class so that, under `--dist loadgroup`, each xdist
+# worker checks whole classes and builds only the instance fixtures it needs.
+_static_method_cases = []
+_instance_method_cases = []
+for _class_name, _class_spec in _CLASS_ITEMS:
+    _group = pytest.mark.xdist_group(_class_name)
+    for _cases, _key in (
+        (_static_method_cases, "static_methods"),
+        (_instance_method_cases, "instance_methods"),
+    ):
+        for _method in _class_spec.get(_key, []):
+            _id = f"{_class_name}.{_method['name']}"
+            _cases.append(pytest.param(_class_name, _method, id=_id, marks=_group))
 
 
-@pytest.mark.parametrize(
-    "class_name,method_spec",
-    _static_method_param_cases,
-    ids=[f"{c}.{m['name']}_params" for c, m in _static_method_param_cases],
-)
-def test_static_method_parameters(class_name, method_spec):
-    """Static method has the expected parameters."""
-    cls = getattr(holoconf, class_name)
-    method = getattr(cls, method_spec["name"])
-    sig = inspect.signature(method)
-    param_names = list(sig.parameters.keys())
+def _assert_parameters(class_name, method_name, method, params):
+    """Check that a method accepts every parameter listed in its spec."""
+    param_names = _sig_params(method)
 
-    for param_spec in method_spec["parameters"]:
-        assert param_spec["name"] in param_names, (
-            f"{class_name}.{method_spec['name']} missing parameter '{param_spec['name']}'"
-        )
+    missing = [p["name"] for p in params if p["name"] not in param_names]
+    assert not missing, f"{class_name}.{method_name} missing parameters {missing}"
 
 
-# Generate instance method test cases
-_instance_method_cases = [
-    (class_name, method)
-    for class_name, class_spec in PARITY_SPEC["classes"].items()
-    for method in class_spec.get("instance_methods", [])
-]
-
-
-@pytest.fixture
-def config_instance():
-    """Create a Config instance for testing instance methods."""
-    return holoconf.Config.loads("key: value")
-
+@pytest.mark.parametrize("class_name,method_spec", _static_method_cases)
+def test_static_method_exists(class_name, method_spec):
+    """Static method exists on the class and has the expected parameters."""
+    method_name = method_spec["name"]
+    method = getattr(_CLASSES[class_name], method_name, None)
+    assert method is not None, f"{class_name}.{method_name} not found"
+    assert callable(method)
 
-@pytest.fixture
-def schema_instance():
-    """Create a Schema instance for testing instance methods."""
-    return holoconf.Schema.from_yaml("type: object")
+    params = method_spec.get("parameters")
+    if params:
+        _assert_parameters(class_name, method_name, method, params)
 
 
-@pytest.mark.parametrize(
-    "class_name,method_spec",
-    _instance_method_cases,
-    ids=[f"{c}.{m['name']}" for c, m in _instance_method_cases],
-)
+# config_instance and schema_instance are session fixtures from conftest.py
+@pytest.mark.parametrize("class_name,method_spec", _instance_method_cases)
 def test_instance_method_exists(class_name, method_spec, config_instance, schema_instance):
-    """Instance method exists on the class."""
+    """Instance method exists on the class and has the expected parameters."""
     # Get an instance of the appropriate class
     if class_name == "Config":
         instance = config_instance
@@ -166,42 +149,13 @@ def test_instance_method_exists(class_name, method_spec, config_instance, schema
         pytest.skip(f"No fixture for {class_name}")
 
     method_name = method_spec["name"]
-    assert hasattr(instance, method_name), f"{class_name}.{method_name} not found"
-    assert callable(getattr(instance, method_name))
-
-
-# Generate instance method parameter test cases
-_instance_method_param_cases = [
-    (class_name, method)
-    for class_name, class_spec in PARITY_SPEC["classes"].items()
-    for method in class_spec.get("instance_methods", [])
-    if method.get("parameters")
-]
-
-
-@pytest.mark.parametrize(
-    "class_name,method_spec",
-    _instance_method_param_cases,
-    ids=[f"{c}.{m['name']}_params" for c, m in _instance_method_param_cases],
-)
-def test_instance_method_parameters(class_name, method_spec, config_instance, schema_instance):
-    """Instance method has the expected parameters."""
-    # Get an instance of the appropriate class
-    if class_name == "Config":
-        instance = config_instance
-    elif class_name == "Schema":
-        instance = schema_instance
-    else:
-        pytest.skip(f"No fixture for {class_name}")
-
-    method = getattr(instance, method_spec["name"])
-    sig = inspect.signature(method)
-    param_names = list(sig.parameters.keys())
+    method = getattr(instance, method_name, None)
+    assert method is not None, f"{class_name}.{method_name} not found"
+    assert callable(method)
 
-    for param_spec in method_spec["parameters"]:
-        assert param_spec["name"] in param_names, (
-            f"{class_name}.{method_spec['name']} missing parameter '{param_spec['name']}'"
-        )
+    params = method_spec.get("parameters")
+    if params:
+        _assert_parameters(class_name, method_name, method, params)
 
 
 # =============================================================================
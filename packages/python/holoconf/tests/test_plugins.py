@@ -0,0 +1,69 @@
+"""
+Plugin Discovery Tests for Python Bindings
+
+These tests cover discover_plugins(): entry points are scanned once and the
+result is reused until a caller forces a new scan.
+"""
+
+import pytest
+
+import holoconf
+
+
+class FakeEntryPoint:
+    """Stand-in for an importlib.metadata entry point."""
+
+    def __init__(self, name, register):
+        self.name = name
+        self.value = f"fake_plugin:{name}"
+        self._register = register
+
+    def load(self):
+        return self._register
+
+
+@pytest.fixture
+def fake_plugins(monkeypatch):
+    """Replace entry point scanning with one fake plugin; returns the scan/register counts."""
+    counts = {"scans": 0, "registered": 0}
+
+    def register():
+        counts["registered"] += 1
+
+    def resolver_entry_points():
+        counts["scans"] += 1
+        return [FakeEntryPoint("fake", register)]
+
+    monkeypatch.setattr(holoconf, "_resolver_entry_points", resolver_entry_points)
+    # Start from "never discovered" (the real pass already ran at import)
+    monkeypatch.setattr(holoconf, "_discovered", None)
+    return counts
+
+
+class TestDiscoverPlugins:
+    """Test memoization of plugin discovery."""
+
+    def test_first_call_scans(self, fake_plugins):
+        """The first call scans entry points and registers each plugin."""
+        assert holoconf.discover_plugins() == ["fake"]
+        assert fake_plugins == {"scans": 1, "registered": 1}
+
+    def test_second_call_is_memoized(self, fake_plugins):
+        """A second call returns the same names without scanning again."""
+        holoconf.discover_plugins()
+
+        assert holoconf.discover_plugins() == ["fake"]
+        assert fake_plugins == {"scans": 1, "registered": 1}
+
+    def test_force_scans_again(self, fake_plugins):
+        """force=True scans entry points and registers plugins again."""
+        holoconf.discover_plugins()
+
+        assert holoconf.discover_plugins(force=True) == ["fake"]
+        assert fake_plugins == {"scans": 2, "registered": 2}
+
+    def test_returns_copy(self, fake_plugins):
+        """Changing the returned list doesn't change what later calls return."""
+        holoconf.discover_plugins().append("other")
+
+        assert holoconf.discover_plugins() == ["fake"]
@@ -16,51 +16,97 @@ import argparse
 import re
 import subprocess
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
+REPO_ROOT = Path(__file__).parent.parent
+
+# Content between [Unreleased] and the next version header
+UNRELEASED_RE = re.compile(r"## \[Unreleased\]\s*\n(.*?)(?=\n## \[|\Z)", re.DOTALL)
+# Bold status value in a feature spec, e.g. "**Status**: **Implemented**"
+STATUS_RE = re.compile(r"\*\*(\w+)\*\*")
+# Added line defining a test function (def test_ or async def test_)
+PYTHON_TEST_RE = re.compile(r"\+\s*(?:async\s+)?def test_")
+
+# `git diff --name-status` codes we report on, keyed by first character
+CHANGE_TYPES = {"A": "added", "M": "modified", "D": "deleted"}
+
 
 def run_git(args: list[str]) -> str:
     """Run a git command and return stdout."""
+    # stderr is never read, so discard it rather than piping it back
     result = subprocess.run(
-        ["git"] + args,
-        capture_output=True,
+        ["git", *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         text=True,
-        cwd=Path(__file__).parent.parent,
+        cwd=REPO_ROOT,
+        check=False,
     )
     return result.stdout.strip()
 
 
+def iter_git(args: list[str]) -> Iterator[str]:
+    """Run a git command and yield its stdout line by line as it is produced.
+
+    Used for commands whose output can be large (diffs), so it never has
+    to be held in memory all at once.
+    """
+    with subprocess.Popen(
+        ["git", *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        cwd=REPO_ROOT,
+    ) as proc:
+        for line in proc.stdout:
+            yield line.rstrip("\n")
+
+
 def get_latest_tag() -> str | None:
     """Get the most recent v* tag."""
     tags = run_git(["tag", "-l", "v*", "--sort=-v:refname"])
     if tags:
-        return tags.split("\n")[0]
+        return tags.partition("\n")[0]
     return None
 
 
 def get_changed_files(base: str) -> dict[str, list[str]]:
     """Get files changed since base, categorized by change type."""
-    # A = added, M = modified, D = deleted
-    diff_output = run_git(["diff", "--name-status", f"{base}..HEAD"])
-
     changes: dict[str, list[str]] = {"added": [], "modified": [], "deleted": []}
 
-    for line in diff_output.split("\n"):
-        if not line:
-            continue
-        parts = line.split("\t")
-        if len(parts) >= 2:
-            status, filepath = parts[0], parts[1]
-            if status.startswith("A"):
-                changes["added"].append(filepath)
-            elif status.startswith("M"):
-                changes["modified"].append(filepath)
-            elif status.startswith("D"):
-                changes["deleted"].append(filepath)
+    for line in iter_git(["diff", "--name-status", f"{base}..HEAD"]):
+        status, _, filepath = line.partition("\t")
+        category = CHANGE_TYPES.get(status[:1])
+        if category and filepath:
+            changes[category].append(filepath)
 
     return changes
 
 
+def get_file_diffs(base: str, files: list[str]) -> dict[str, list[str]]:
+    """Get the added and removed lines for each of the given files since base.
+
+    Streams a single `git diff` for all files and splits it on the per-file
+    `diff --git` headers. Only +/- lines are kept, since those are all the
+    checks look at.
+    """
+    if not files:
+        return {}
+
+    diffs: dict[str, list[str]] = {}
+    lines: list[str] = []
+    for line in iter_git(["diff", f"{base}..HEAD", "--", *files]):
+        if line.startswith("diff --git "):
+            # Header is "diff --git a/<path> b/<path>"
+            path = line.rsplit(" b/", 1)[-1]
+            lines = diffs.setdefault(path, [])
+        elif line.startswith(("+", "-")):
+            lines.append(line)
+
+    return diffs
+
+
 def get_unreleased_section() -> str:
     """Extract the [Unreleased] section from CHANGELOG.md."""
     changelog_path = Path(__file__).parent.parent / "CHANGELOG.md"
@@ -69,26 +115,18 @@ def get_unreleased_section() -> str:
 
     content = changelog_path.read_text()
 
-    # Find content between [Unreleased] and the next version header
-    match = re.search(
-        r"## \[Unreleased\]\s*\n(.*?)(?=\n## \[|\Z)",
-        content,
-        re.DOTALL
-    )
+    match = UNRELEASED_RE.search(content)
 
     if match:
         return match.group(1).strip()
     return ""
 
 
-def count_rust_tests(filepath: str, base: str) -> int:
-    """Count new #[test] functions in a Rust file since base."""
-    # Get the diff for this file
-    diff = run_git(["diff", f"{base}..HEAD", "--", filepath])
-
+def count_rust_tests(diff: list[str]) -> int:
+    """Count new #[test] functions in a Rust file's diff lines."""
     # Count added lines that look like test functions
     new_tests = 0
-    for line in diff.split("\n"):
+    for line in diff:
         if line.startswith("+") and not line.startswith("+++"):
             if "#[test]" in line or "fn test_" in line:
                 new_tests += 1
@@ -96,43 +134,71 @@ def count_rust_tests(filepath: str, base: str) -> int:
     return new_tests
 
 
-def count_python_tests(filepath: str, base: str) -> int:
-    """Count new test functions in a Python file since base."""
-    diff = run_git(["diff", f"{base}..HEAD", "--", filepath])
-
+def count_python_tests(diff: list[str]) -> int:
+    """Count new test functions in a Python file's diff lines."""
     new_tests = 0
-    for line in diff.split("\n"):
+    for line in diff:
         if line.startswith("+") and not line.startswith("+++"):
-            # Match def test_ or async def test_
-            if re.match(r"\+\s*(async\s+)?def test_", line):
+            if PYTHON_TEST_RE.match(line):
                 new_tests += 1
 
     return new_tests
 
 
-def get_feature_spec_changes(changes: dict[str, list[str]], base: str) -> list[dict]:
-    """Detect feature spec status changes."""
+def categorize_changes(changes: dict[str, list[str]]) -> dict[str, list[str]]:
+    """Sort added and modified files into the groups the report covers.
+
+    Each file is inspected once; groups keep the order files appear in
+    `changes` (added files first).
+    """
+    groups: dict[str, list[str]] = {
+        "acceptance_added": [],
+        "acceptance_modified": [],
+        "rust": [],
+        "python": [],
+        "features_added": [],
+        "features_modified": [],
+        "adrs_added": [],
+    }
+
+    for kind in ("added", "modified"):
+        for f in changes[kind]:
+            if f.endswith(".yaml"):
+                if f.startswith("tests/acceptance/"):
+                    groups[f"acceptance_{kind}"].append(f)
+            elif f.endswith(".md"):
+                if f.startswith("docs/specs/features/FEAT-"):
+                    groups[f"features_{kind}"].append(f)
+                elif kind == "added" and f.startswith("docs/adr/ADR-"):
+                    groups["adrs_added"].append(f)
+            elif f.endswith(".rs"):
+                if "test" in f.lower() or f.startswith("crates/"):
+                    groups["rust"].append(f)
+            elif f.endswith(".py"):
+                if "test_" in f or "_test.py" in f:
+                    groups["python"].append(f)
+
+    return groups
+
+
+def get_feature_spec_changes(
+    feature_files: list[str], diffs: dict[str, list[str]]
+) -> list[dict]:
+    """Detect status changes in the given (modified) feature specs."""
     feature_changes = []
-    feature_files = [
-        f for f in changes["modified"]
-        if f.startswith("docs/specs/features/FEAT-") and f.endswith(".md")
-    ]
 
     for filepath in feature_files:
-        # Get the diff to check for status changes
-        diff = run_git(["diff", f"{base}..HEAD", "--", filepath])
-
         # Look for status line changes
         old_status = None
         new_status = None
 
-        for line in diff.split("\n"):
+        for line in diffs.get(filepath, []):
             if line.startswith("-") and "Status" in line:
-                match = re.search(r"\*\*(\w+)\*\*", line)
+                match = STATUS_RE.search(line)
                 if match:
                     old_status = match.group(1)
             elif line.startswith("+") and "Status" in line:
-                match = re.search(r"\*\*(\w+)\*\*", line)
+                match = STATUS_RE.search(line)
                 if match:
                     new_status = match.group(1)
 
@@ -175,7 +241,7 @@ def main():
     print("Current [Unreleased] section:")
     print("-" * 40)
     if unreleased:
-        for line in unreleased.split("\n"):
+        for line in unreleased.splitlines():
             if line.strip():
                 print(f"  {line}")
     else:
@@ -188,8 +254,23 @@ def main():
     print("Changes since", base, "that may need changelog entries:")
     print()
 
+    # Deleted files never show up in the report, so with nothing added or
+    # modified there is nothing to diff or categorize
+    if not (changes["added"] or changes["modified"]):
+        print("=" * 70)
+        print("No significant test or feature changes detected.")
+        print("=" * 70)
+        return 0
+
+    groups = categorize_changes(changes)
+
+    # Diff the files the per-file checks below read, in one git call up front
+    # (get_file_diffs skips git entirely when there are none)
+    diff_files = groups["rust"] + groups["python"] + groups["features_modified"]
+    diffs = get_file_diffs(base, list(dict.fromkeys(diff_files)))
+
     # Feature spec changes
-    feature_changes = get_feature_spec_changes(changes, base)
+    feature_changes = get_feature_spec_changes(groups["features_modified"], diffs)
     if feature_changes:
         print("  Feature Specs:")
         for fc in feature_changes:
@@ -198,8 +279,8 @@ def main():
 
     # Acceptance tests
     acceptance_tests = {
-        "added": [f for f in changes["added"] if f.startswith("tests/acceptance/") and f.endswith(".yaml")],
-        "modified": [f for f in changes["modified"] if f.startswith("tests/acceptance/") and f.endswith(".yaml")],
+        "added": groups["acceptance_added"],
+        "modified": groups["acceptance_modified"],
     }
 
     if acceptance_tests["added"] or acceptance_tests["modified"]:
@@ -212,14 +293,9 @@ def main():
         print()
 
     # Rust unit tests
-    rust_test_files = [
-        f for f in changes["added"] + changes["modified"]
-        if f.endswith(".rs") and ("test" in f.lower() or f.startswith("crates/"))
-    ]
-
     rust_test_changes = []
-    for f in rust_test_files:
-        count = count_rust_tests(f, base)
+    for f in groups["rust"]:
+        count = count_rust_tests(diffs.get(f, []))
         if count > 0:
             rust_test_changes.append((f, count))
 
@@ -231,14 +307,9 @@ def main():
         print()
 
     # Python unit tests
-    python_test_files = [
-        f for f in changes["added"] + changes["modified"]
-        if f.endswith(".py") and ("test_" in f or "_test.py" in f)
-    ]
-
     python_test_changes = []
-    for f in python_test_files:
-        count = count_python_tests(f, base)
+    for f in groups["python"]:
+        count = count_python_tests(diffs.get(f, []))
         if count > 0:
             python_test_changes.append((f, count))
 
@@ -250,10 +321,7 @@ def main():
         print()
 
     # New feature specs
-    new_feature_specs = [
-        f for f in changes["added"]
-        if f.startswith("docs/specs/features/FEAT-") and f.endswith(".md")
-    ]
+    new_feature_specs = groups["features_added"]
     if new_feature_specs:
         print("  New Feature Specs:")
         for f in new_feature_specs:
@@ -261,10 +329,7 @@ def main():
         print()
 
     # New ADRs
-    new_adrs = [
-        f for f in changes["added"]
-        if f.startswith("docs/adr/ADR-") and f.endswith(".md")
-    ]
+    new_adrs = groups["adrs_added"]
     if new_adrs:
         print("  New ADRs:")
         for f in new_adrs:
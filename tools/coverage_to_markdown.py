@@ -5,48 +5,89 @@ This script parses coverage reports from cargo-llvm-cov (JSON/Cobertura/LCOV) an
 pytest-cov (Cobertura XML) and outputs markdown-formatted tables for MkDocs.
 """
 
-import json
+import mmap
+import operator
+import os
+import re
 import sys
-import xml.etree.ElementTree as ET
 from pathlib import Path
 
+# lxml parses large Cobertura reports much faster; the stdlib parser is the fallback
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+# Likewise orjson for JSON; both loaders accept the raw (undecoded) file bytes
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+# Sort key for file entries; parsers return their files already sorted by it
+by_name = operator.itemgetter("name")
+
+# Status icons indexed by how many thresholds (50%, 80%) a percentage reaches
+STATUS_ICONS = ("🔴", "🟡", "🟢")
+
+
+def coverage_status(pct: float) -> str:
+    """Status icon for a coverage percentage: red below 50%, yellow below 80%, else green."""
+    return STATUS_ICONS[(pct >= 50) + (pct >= 80)]
+
 
 def parse_cobertura_xml(xml_path: Path) -> dict:
-    """Parse Cobertura XML coverage format (works for both Python and Rust)."""
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
+    """Parse Cobertura XML coverage format (works for both Python and Rust).
+
+    The report is streamed with iterparse (end events only). The per-line
+    <lines>/<methods> subtrees are dropped as soon as they close, and each
+    <class> and <package> is cleared once read, so memory stays flat no
+    matter how large the report is.
+    """
+    files = []
+    pending = []  # classes read since the last </package>; only those inside one count
+    elem = None
+
+    for _, elem in ET.iterparse(str(xml_path)):
+        tag = elem.tag
+        if tag in ("lines", "methods"):
+            elem.clear()
+            continue
+        if tag == "package":
+            files.extend(pending)
+            pending.clear()
+            elem.clear()
+            continue
+        if tag != "class":
+            continue
+
+        filename = elem.get("filename", "")
+        name = elem.get("name")
+        if name is None:
+            name = filename.rpartition("/")[2]
+        file_line_rate = float(elem.get("line-rate", 0))
+        pct = file_line_rate * 100
+
+        pending.append({
+            "name": name,
+            "path": filename,
+            "coverage": f"{pct:.0f}%",
+            "line_rate": file_line_rate,
+            "status": coverage_status(pct),
+        })
+        elem.clear()
 
-    # Get overall stats from root attributes
+    # The root element closes last; its attributes hold the overall stats
+    root = elem
     line_rate = float(root.get("line-rate", 0))
     lines_valid = int(root.get("lines-valid", 0))
     lines_covered = int(root.get("lines-covered", 0))
 
-    files = []
-    for package in root.findall(".//package"):
-        for cls in package.findall(".//class"):
-            filename = cls.get("filename", "")
-            name = cls.get("name", filename.split("/")[-1])
-            file_line_rate = float(cls.get("line-rate", 0))
-            pct = file_line_rate * 100
-
-            # Determine status
-            if pct >= 80:
-                status = "🟢"
-            elif pct >= 50:
-                status = "🟡"
-            else:
-                status = "🔴"
-
-            files.append({
-                "name": name,
-                "path": filename,
-                "coverage": f"{pct:.0f}%",
-                "line_rate": file_line_rate,
-                "status": status,
-            })
-
+    files.sort(key=by_name)
     return {
         "files": files,
+        "files_sorted": True,
         "total_line_rate": line_rate,
         "total_coverage": f"{line_rate * 100:.0f}%",
         "lines_covered": lines_covered,
@@ -56,34 +97,27 @@ def parse_cobertura_xml(xml_path: Path) -> dict:
 
 def parse_llvm_cov_json(json_path: Path) -> dict:
     """Parse cargo-llvm-cov JSON format."""
-    data = json.loads(json_path.read_text())
+    data = json_loads(json_path.read_bytes())
 
     files = []
     totals = data.get("data", [{}])[0].get("totals", {})
 
     for file_data in data.get("data", [{}])[0].get("files", []):
         filename = file_data.get("filename", "")
-        name = filename.split("/")[-1]
+        name = filename.rpartition("/")[2]
         summary = file_data.get("summary", {})
         lines = summary.get("lines", {})
         covered = lines.get("covered", 0)
         total = lines.get("count", 0)
         pct = (covered / total * 100) if total > 0 else 0
 
-        if pct >= 80:
-            status = "🟢"
-        elif pct >= 50:
-            status = "🟡"
-        else:
-            status = "🔴"
-
         files.append({
             "name": name,
             "path": filename,
             "coverage": f"{pct:.1f}%",
             "covered": covered,
             "total": total,
-            "status": status,
+            "status": coverage_status(pct),
         })
 
     # Calculate totals
@@ -92,8 +126,10 @@ def parse_llvm_cov_json(json_path: Path) -> dict:
     total_count = total_lines.get("count", 0)
     total_pct = (total_covered / total_count * 100) if total_count > 0 else 0
 
+    files.sort(key=by_name)
     return {
         "files": files,
+        "files_sorted": True,
         "total_coverage": f"{total_pct:.1f}%",
         "lines_covered": total_covered,
         "lines_valid": total_count,
@@ -101,56 +137,95 @@ def parse_llvm_cov_json(json_path: Path) -> dict:
 
 
 # Files to exclude from per-file display (tested via acceptance tests, not unit tests)
-EXCLUDED_FILES = {"cli.rs", "main.rs"}
+EXCLUDED_FILES = frozenset({"cli.rs", "main.rs"})
 
 # Package groupings for rollup display
 PACKAGE_GROUPS = {
-    "holoconf-core": ["config.rs", "value.rs", "resolver.rs", "interpolation.rs", "schema.rs", "error.rs"],
-    "holoconf-cli": ["cli.rs", "main.rs"],
-    "holoconf-python": ["lib.rs"],
+    "holoconf-core": frozenset(
+        {"config.rs", "value.rs", "resolver.rs", "interpolation.rs", "schema.rs", "error.rs"}
+    ),
+    "holoconf-cli": frozenset({"cli.rs", "main.rs"}),
+    "holoconf-python": frozenset({"lib.rs"}),
 }
 
+# Reverse of PACKAGE_GROUPS: file name -> package
+FILE_PACKAGES = {
+    filename: pkg_name for pkg_name, pkg_files in PACKAGE_GROUPS.items() for filename in pkg_files
+}
+
+
+# The LCOV records parse_lcov() reads; lastgroup names which one matched
+LCOV_RECORD_RE = re.compile(
+    rb"^(?:SF:(?P<sf>[^\r\n]+)|LF:(?P<lf>\d+)|LH:(?P<lh>\d+)|(?P<end>end_of_record))\r?$",
+    re.MULTILINE,
+)
+
+
+def _lcov_records(lcov_path: Path):
+    """Yield LCOV_RECORD_RE matches from a report without reading it into memory.
+
+    The file is memory-mapped, so the OS pages it in (and out) as the scan
+    advances instead of holding a full copy as a Python bytes object.
+    """
+    with lcov_path.open("rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return  # empty files can't be mapped
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from LCOV_RECORD_RE.finditer(mm)
+
 
-def parse_lcov(lcov_path: Path) -> dict:
-    """Parse LCOV format coverage data."""
+def parse_lcov(lcov_path: Path, detail: bool = True) -> dict:
+    """Parse LCOV format coverage data.
+
+    With detail=False only the totals are computed: no per-file entries or
+    package rollups are built, which is all a summary needs.
+    """
     files = []
     current_file = None
     current_lines_found = 0
     current_lines_hit = 0
     total_lines_found = 0
     total_lines_hit = 0
-
-    for line in lcov_path.read_text().splitlines():
-        if line.startswith("SF:"):
-            current_file = line[3:]
+    lib_covered = 0
+    lib_total = 0
+
+    # Only SF/LF/LH/end_of_record lines matter; the regex skips all the
+    # per-line (DA/BRDA/FN...) records in C instead of looping over them
+    for match in _lcov_records(lcov_path):
+        kind = match.lastgroup
+        if kind == "sf":
+            current_file = match["sf"].decode("utf-8")
             current_lines_found = 0
             current_lines_hit = 0
-        elif line.startswith("LF:"):
-            current_lines_found = int(line[3:])
-        elif line.startswith("LH:"):
-            current_lines_hit = int(line[3:])
-        elif line == "end_of_record" and current_file:
-            pct = (current_lines_hit / current_lines_found * 100) if current_lines_found > 0 else 0
-            name = current_file.split("/")[-1]
+        elif kind == "lf":
+            current_lines_found = int(match["lf"])
+        elif kind == "lh":
+            current_lines_hit = int(match["lh"])
+        elif current_file:
+            name = current_file.rpartition("/")[2]
 
             # Skip test files and focus on source
             if "/tests/" not in current_file:
-                if pct >= 80:
-                    status = "🟢"
-                elif pct >= 50:
-                    status = "🟡"
-                else:
-                    status = "🔴"
-
-                files.append({
-                    "name": name,
-                    "path": current_file,
-                    "coverage": f"{pct:.1f}%",
-                    "covered": current_lines_hit,
-                    "total": current_lines_found,
-                    "status": status,
-                    "excluded": name in EXCLUDED_FILES,
-                })
+                excluded = name in EXCLUDED_FILES
+                # Library coverage excludes CLI files
+                if not excluded:
+                    lib_covered += current_lines_hit
+                    lib_total += current_lines_found
+
+                if detail:
+                    pct = (
+                        (current_lines_hit / current_lines_found * 100) if current_lines_found > 0 else 0
+                    )
+
+                    files.append({
+                        "name": name,
+                        "path": current_file,
+                        "coverage": f"{pct:.1f}%",
+                        "covered": current_lines_hit,
+                        "total": current_lines_found,
+                        "status": coverage_status(pct),
+                        "excluded": excluded,
+                    })
 
             total_lines_found += current_lines_found
             total_lines_hit += current_lines_hit
@@ -158,28 +233,32 @@ def parse_lcov(lcov_path: Path) -> dict:
 
     total_pct = (total_lines_hit / total_lines_found * 100) if total_lines_found > 0 else 0
 
-    # Calculate package-level rollups
+    # Calculate package-level rollups in one pass over the files
+    pkg_lines = {pkg_name: [0, 0] for pkg_name in PACKAGE_GROUPS}  # [covered, total]
+    for f in files:
+        pkg_name = FILE_PACKAGES.get(f["name"])
+        if pkg_name:
+            pkg_lines[pkg_name][0] += f["covered"]
+            pkg_lines[pkg_name][1] += f["total"]
+
     packages = {}
-    for pkg_name, pkg_files in PACKAGE_GROUPS.items():
-        pkg_covered = sum(f["covered"] for f in files if f["name"] in pkg_files)
-        pkg_total = sum(f["total"] for f in files if f["name"] in pkg_files)
+    for pkg_name, (pkg_covered, pkg_total) in pkg_lines.items():
         pkg_pct = (pkg_covered / pkg_total * 100) if pkg_total > 0 else 0
         if pkg_total > 0:
             packages[pkg_name] = {
                 "coverage": f"{pkg_pct:.1f}%",
                 "covered": pkg_covered,
                 "total": pkg_total,
-                "status": "🟢" if pkg_pct >= 80 else ("🟡" if pkg_pct >= 50 else "🔴"),
+                "status": coverage_status(pkg_pct),
             }
 
     # Calculate library-only coverage (excluding CLI)
-    lib_files = [f for f in files if not f.get("excluded", False)]
-    lib_covered = sum(f["covered"] for f in lib_files)
-    lib_total = sum(f["total"] for f in lib_files)
     lib_pct = (lib_covered / lib_total * 100) if lib_total > 0 else 0
 
+    files.sort(key=by_name)
     return {
         "files": files,
+        "files_sorted": True,
         "packages": packages,
         "total_coverage": f"{total_pct:.1f}%",
         "lib_coverage": f"{lib_pct:.1f}%",
@@ -201,14 +280,12 @@ def to_markdown(data: dict, title: str = None, detail: bool = True) -> str:
     lines = []
 
     if title:
-        lines.append(f"### {title}")
-        lines.append("")
+        lines.extend((f"### {title}", ""))
 
     # Show package-level rollups if available
     packages = data.get("packages", {})
     if detail and packages:
-        lines.append("| Package | Coverage | Status |")
-        lines.append("|---------|----------|--------|")
+        lines.extend(("| Package | Coverage | Status |", "|---------|----------|--------|"))
         for pkg_name in ["holoconf-core", "holoconf-python", "holoconf-cli"]:
             if pkg_name in packages:
                 pkg = packages[pkg_name]
@@ -221,16 +298,19 @@ def to_markdown(data: dict, title: str = None, detail: bool = True) -> str:
         # Filter out excluded files for display
         display_files = [f for f in data["files"] if not f.get("excluded", False)]
         if display_files:
-            lines.append("<details>")
-            lines.append("<summary>Per-file coverage</summary>")
-            lines.append("")
-            lines.append("| File | Coverage | Status |")
-            lines.append("|------|----------|--------|")
-            for f in sorted(display_files, key=lambda x: x["name"]):
-                lines.append(f"| `{f['name']}` | {f['coverage']} | {f['status']} |")
-            lines.append("")
-            lines.append("</details>")
-            lines.append("")
+            lines.extend((
+                "<details>",
+                "<summary>Per-file coverage</summary>",
+                "",
+                "| File | Coverage | Status |",
+                "|------|----------|--------|",
+            ))
+            if not data.get("files_sorted"):
+                display_files.sort(key=by_name)
+            lines.extend(
+                f"| `{f['name']}` | {f['coverage']} | {f['status']} |" for f in display_files
+            )
+            lines.extend(("", "</details>", ""))
 
     # Show library coverage as the main metric (excludes CLI)
     lib_coverage = data.get("lib_coverage")
@@ -253,12 +333,14 @@ def parse_acceptance_results(results_dir: Path) -> dict:
     Expects files like: results_dir/rust.json, results_dir/python.json
     """
     drivers = {}
-    all_suites = {}  # suite_name -> {description, tests: {test_name -> True}}
+    # suite_name -> {description, tests: {test_name -> {driver -> passed}},
+    #                passed: {driver -> number of tests that passed}}
+    all_suites = {}
 
     # Find all JSON result files
     for json_file in sorted(results_dir.glob("*.json")):
         driver_name = json_file.stem
-        data = json.loads(json_file.read_text())
+        data = json_loads(json_file.read_bytes())
 
         drivers[driver_name] = {
             "total": data.get("total", 0),
@@ -269,21 +351,29 @@ def parse_acceptance_results(results_dir: Path) -> dict:
         # Collect all suites and tests
         for suite in data.get("suites", []):
             suite_name = suite["suite"]
-            if suite_name not in all_suites:
-                all_suites[suite_name] = {
+            suite_entry = all_suites.get(suite_name)
+            if suite_entry is None:
+                suite_entry = all_suites[suite_name] = {
                     "description": suite.get("description", ""),
                     "tests": {},
+                    "passed": {},
                 }
+            suite_tests = suite_entry["tests"]
+            passed_count = suite_entry["passed"].get(driver_name, 0)
 
             for test in suite.get("tests", []):
-                test_name = test["name"]
-                if test_name not in all_suites[suite_name]["tests"]:
-                    all_suites[suite_name]["tests"][test_name] = {}
-                all_suites[suite_name]["tests"][test_name][driver_name] = test["passed"]
+                passed = test["passed"]
+                results = suite_tests.setdefault(test["name"], {})
+                # Keep the pass count in step if a test is reported twice
+                passed_count += (passed is True) - (results.get(driver_name) is True)
+                results[driver_name] = passed
+
+            suite_entry["passed"][driver_name] = passed_count
 
     return {
         "drivers": drivers,
-        "suites": all_suites,
+        # Sorted by suite name, the order they are rendered in
+        "suites": dict(sorted(all_suites.items())),
     }
 
 
@@ -306,27 +396,19 @@ def acceptance_to_markdown(data: dict, detail: bool = True) -> str:
 
     if detail and data["suites"]:
         # Summary table by suite with pass rates
-        header = "| Suite | Tests |"
-        separator = "|:------|------:|"
-        for driver in drivers:
-            header += f" {driver.title()} |"
-            separator += ":------:|"
-        lines.append(header)
-        lines.append(separator)
+        lines.append("| Suite | Tests |" + "".join(f" {driver.title()} |" for driver in drivers))
+        lines.append("|:------|------:|" + ":------:|" * len(drivers))
 
         # Calculate per-suite stats
-        for suite_name in sorted(data["suites"].keys()):
-            suite = data["suites"][suite_name]
-            tests = suite["tests"]
-            test_count = len(tests)
-
-            row = f"| {humanize_name(suite_name)} | {test_count} |"
+        for suite_name, suite in data["suites"].items():
+            test_count = len(suite["tests"])
 
+            cells = []
             for driver in drivers:
-                passed = sum(1 for t in tests.values() if t.get(driver) is True)
+                passed = suite["passed"].get(driver, 0)
                 pct = int(passed / test_count * 100) if test_count > 0 else 0
-                row += f" {pct}% |"
-            lines.append(row)
+                cells.append(f" {pct}% |")
+            lines.append(f"| {humanize_name(suite_name)} | {test_count} |" + "".join(cells))
 
         lines.append("")
 
@@ -351,13 +433,15 @@ def detect_format(file_path: Path) -> str:
     elif suffix == ".info" or file_path.name.endswith("-lcov.info"):
         return "lcov"
     else:
-        # Try to detect from content
-        content = file_path.read_text()[:100]
-        if content.strip().startswith("{"):
+        # Try to detect from the first bytes of content (no need to read or decode it all)
+        with file_path.open("rb") as fh:
+            head = fh.read(100)
+        stripped = head.lstrip()
+        if stripped.startswith(b"{"):
             return "json"
-        elif content.strip().startswith("<?xml") or content.strip().startswith("<coverage"):
+        elif stripped.startswith((b"<?xml", b"<coverage")):
             return "cobertura"
-        elif content.startswith("SF:"):
+        elif head.startswith(b"SF:"):
             return "lcov"
     return "unknown"
 
@@ -387,7 +471,7 @@ def main():
     elif fmt == "cobertura":
         data = parse_cobertura_xml(args.file)
     elif fmt == "lcov":
-        data = parse_lcov(args.file)
+        data = parse_lcov(args.file, detail=not args.summary_only)
     else:
         print(f"Error: Could not detect format of {args.file}", file=sys.stderr)
         sys.exit(1)
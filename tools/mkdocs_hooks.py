@@ -4,21 +4,232 @@ This module provides hooks for MkDocs to generate dynamic content like
 coverage reports at build time.
 """
 
+import functools
+import hashlib
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Import coverage parser
-from coverage_to_markdown import (
-    acceptance_to_markdown,
-    parse_acceptance_results,
-    parse_cobertura_xml,
-    parse_lcov,
-    to_markdown,
-)
-
 # Project root
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# Coverage reports and acceptance results written by the Makefile targets
+COVERAGE_DIR = PROJECT_ROOT / "coverage"
+
+# Rendered coverage markdown kept between builds, named by a hash of its inputs
+CACHE_DIR = PROJECT_ROOT / ".mkdocs-coverage-cache"
+
+# Most rendered files kept there; each changed report adds two (full table and summary)
+CACHE_MAX_ENTRIES = 32
+
+# The renderer's own source is part of every cache key, so changing it invalidates the cache
+RENDERER_SOURCE = Path(__file__).with_name("coverage_to_markdown.py")
+
+# Shown in place of a section whose input has not been generated yet
+COVERAGE_WARNING = (
+    "!!! warning \"Coverage not available\"\n"
+    "    Run `make coverage` to generate coverage reports."
+)
+ACCEPTANCE_COVERAGE_WARNING = (
+    "!!! warning \"Acceptance coverage not available\"\n"
+    "    Run `make coverage-acceptance` to generate acceptance test coverage."
+)
+ACCEPTANCE_RESULTS_WARNING = (
+    "!!! warning \"Acceptance test results not available\"\n"
+    "    Run `make test-acceptance` to generate test results."
+)
+
+# Placeholder sections: section -> (input path, parser and renderer
+# names in coverage_to_markdown, warning shown when the input is missing)
+SECTIONS = {
+    # Rust coverage
+    "coverage:rust": (
+        COVERAGE_DIR / "rust-lcov.info",
+        "parse_lcov",
+        "to_markdown",
+        COVERAGE_WARNING,
+    ),
+    # Python coverage
+    "coverage:python": (
+        COVERAGE_DIR / "python-coverage.xml",
+        "parse_cobertura_xml",
+        "to_markdown",
+        COVERAGE_WARNING,
+    ),
+    # Acceptance test coverage (Rust code coverage from acceptance tests)
+    "coverage:acceptance": (
+        COVERAGE_DIR / "acceptance-lcov.info",
+        "parse_lcov",
+        "to_markdown",
+        ACCEPTANCE_COVERAGE_WARNING,
+    ),
+    # Acceptance test matrix (pass/fail by driver)
+    "acceptance:matrix": (
+        COVERAGE_DIR / "acceptance",
+        "parse_acceptance_results",
+        "acceptance_to_markdown",
+        ACCEPTANCE_RESULTS_WARNING,
+    ),
+}
+
+# Any placeholder above: group 1 is the section, group 2 is set for summaries
+PLACEHOLDER_RE = re.compile(
+    "<!-- (" + "|".join(map(re.escape, SECTIONS)) + ")(:summary)? -->"
+)
+
+# Parsed coverage data and rendered markdown, reused across pages and rebuilds:
+# (path, what) -> (stamp, value), where the stamp changes whenever the input does
+_cache: dict = {}
+
+# Sections rendered in the background by on_files for the current build:
+# section -> Future of {detail: markdown}
+_rendered: dict = {}
+
+# Sections used by any page source in the current build (None until on_files runs)
+_used_sections = None
+
+# Stamps of the coverage inputs, taken once per build: path -> stamp (None if missing)
+_stamps: dict = {}
+
+
+@functools.cache
+def _coverage_module():
+    """Import the coverage parser on first use; builds without placeholders never need it."""
+    import coverage_to_markdown
+
+    return coverage_to_markdown
+
+
+def _file_stamp(path: Path) -> tuple:
+    """Modification time and size of a file; a rewrite changes at least one of them."""
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _stamp(path: Path):
+    """Modification stamp for a coverage file, or for every JSON file in a directory.
+
+    Returns None when there is nothing to read: the file is missing, or the
+    directory is missing or has no JSON files. Computed once per build (see
+    on_config) rather than once per page.
+    """
+    if path not in _stamps:
+        if path.is_dir():
+            json_files = sorted(path.glob("*.json"))
+            stamp = tuple((p.name, _file_stamp(p)) for p in json_files) or None
+        elif path.exists():
+            stamp = _file_stamp(path)
+        else:
+            stamp = None
+        _stamps[path] = stamp
+    return _stamps[path]
+
+
+def _content_key(path: Path) -> str:
+    """Hash of a coverage input (every JSON file, for a directory) and of the renderer."""
+    digest = hashlib.sha256(RENDERER_SOURCE.read_bytes())
+    files = sorted(path.glob("*.json")) if path.is_dir() else [path]
+    for file in files:
+        digest.update(file.name.encode())
+        digest.update(file.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _prune_cache_dir():
+    """Delete the oldest rendered files beyond CACHE_MAX_ENTRIES."""
+    entries = sorted(
+        CACHE_DIR.glob("*.md"), key=lambda entry: entry.stat().st_mtime_ns, reverse=True
+    )
+    for stale in entries[CACHE_MAX_ENTRIES:]:
+        stale.unlink(missing_ok=True)
+
+
+def _render(path: Path, parse, render, detail: bool) -> str:
+    """Render coverage markdown for path, parsing and rendering each input only once.
+
+    Rendered markdown is also written to an on-disk cache keyed by the input's
+    content, so later builds with unchanged reports skip parsing entirely.
+    """
+    stamp = _stamp(path)
+
+    def cached(what, compute):
+        hit = _cache.get((path, what))
+        if hit is not None and hit[0] == stamp:
+            return hit[1]
+        value = compute()
+        _cache[(path, what)] = (stamp, value)
+        return value
+
+    def render_cached():
+        key = cached("key", lambda: _content_key(path))
+        cache_file = CACHE_DIR / f"{key}-{'d' if detail else 's'}.md"
+        try:
+            return cache_file.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            pass
+        markdown = render(cached("data", lambda: parse(path)), detail=detail)
+        # The cache is only an optimisation; a read-only checkout still builds
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            # Write then rename, so a concurrent build never reads a partial file
+            partial = cache_file.with_suffix(".tmp")
+            partial.write_text(markdown, encoding="utf-8")
+            partial.replace(cache_file)
+            _prune_cache_dir()
+        except OSError:
+            pass
+        return markdown
+
+    return cached(detail, render_cached)
+
+
+def _section_markdown(section: str, detail: bool) -> str:
+    """Markdown for one placeholder section, or a warning if its data is missing."""
+    path, parser, renderer, warning = SECTIONS[section]
+    if _stamp(path) is None:
+        return warning
+    module = _coverage_module()
+    return _render(path, getattr(module, parser), getattr(module, renderer), detail=detail)
+
+
+def _render_section(section: str) -> dict:
+    """Both variants of one section: {True: full table, False: summary only}."""
+    return {detail: _section_markdown(section, detail) for detail in (True, False)}
+
+
+def on_config(config):
+    """Reset the per-build state; inputs may have been regenerated since the last build."""
+    global _used_sections
+    _stamps.clear()
+    _rendered.clear()
+    _used_sections = None
+    return config
+
+
+def on_files(files, config):
+    """Start rendering, in the background, the sections that page sources use.
+
+    Pages are processed after this, so by the time one needs a section it has
+    usually been rendered already and on_page_markdown only splices it in.
+    Sections no page uses are never parsed or rendered.
+    """
+    global _used_sections
+    _used_sections = set()
+    for file in files.documentation_pages():
+        if file.abs_src_path is not None:
+            source = Path(file.abs_src_path).read_text(encoding="utf-8", errors="replace")
+            _used_sections.update(match[1] for match in PLACEHOLDER_RE.finditer(source))
+
+    if _used_sections:
+        executor = ThreadPoolExecutor(
+            max_workers=len(_used_sections), thread_name_prefix="coverage"
+        )
+        for section in _used_sections:
+            _rendered[section] = executor.submit(_render_section, section)
+        # Queued renders still run; this only stops the pool from taking new work
+        executor.shutdown(wait=False)
+    return files
+
 
 def on_page_markdown(markdown: str, page, config, files) -> str:
     """Process markdown and replace coverage placeholders.
@@ -33,74 +244,21 @@ def on_page_markdown(markdown: str, page, config, files) -> str:
         <!-- acceptance:matrix --> - Insert acceptance test pass/fail matrix
         <!-- acceptance:matrix:summary --> - Insert acceptance test summary only
     """
-    # Define coverage file locations
-    rust_lcov = PROJECT_ROOT / "coverage" / "rust-lcov.info"
-    python_xml = PROJECT_ROOT / "coverage" / "python-coverage.xml"
-    acceptance_lcov = PROJECT_ROOT / "coverage" / "acceptance-lcov.info"
-    acceptance_results_dir = PROJECT_ROOT / "coverage" / "acceptance"
-
-    # Process Rust coverage placeholders
-    if "<!-- coverage:rust" in markdown:
-        if rust_lcov.exists():
-            data = parse_lcov(rust_lcov)
-            # Full table
-            if "<!-- coverage:rust -->" in markdown:
-                table = to_markdown(data, detail=True)
-                markdown = markdown.replace("<!-- coverage:rust -->", table)
-            # Summary only
-            if "<!-- coverage:rust:summary -->" in markdown:
-                summary = to_markdown(data, detail=False)
-                markdown = markdown.replace("<!-- coverage:rust:summary -->", summary)
-        else:
-            placeholder = "!!! warning \"Coverage not available\"\n    Run `make coverage` to generate coverage reports."
-            markdown = re.sub(r"<!-- coverage:rust(?::summary)? -->", placeholder, markdown)
-
-    # Process Python coverage placeholders
-    if "<!-- coverage:python" in markdown:
-        if python_xml.exists():
-            data = parse_cobertura_xml(python_xml)
-            # Full table
-            if "<!-- coverage:python -->" in markdown:
-                table = to_markdown(data, detail=True)
-                markdown = markdown.replace("<!-- coverage:python -->", table)
-            # Summary only
-            if "<!-- coverage:python:summary -->" in markdown:
-                summary = to_markdown(data, detail=False)
-                markdown = markdown.replace("<!-- coverage:python:summary -->", summary)
-        else:
-            placeholder = "!!! warning \"Coverage not available\"\n    Run `make coverage` to generate coverage reports."
-            markdown = re.sub(r"<!-- coverage:python(?::summary)? -->", placeholder, markdown)
-
-    # Process acceptance test coverage placeholders (Rust code coverage from acceptance tests)
-    if "<!-- coverage:acceptance" in markdown:
-        if acceptance_lcov.exists():
-            data = parse_lcov(acceptance_lcov)
-            # Full table
-            if "<!-- coverage:acceptance -->" in markdown:
-                table = to_markdown(data, detail=True)
-                markdown = markdown.replace("<!-- coverage:acceptance -->", table)
-            # Summary only
-            if "<!-- coverage:acceptance:summary -->" in markdown:
-                summary = to_markdown(data, detail=False)
-                markdown = markdown.replace("<!-- coverage:acceptance:summary -->", summary)
-        else:
-            placeholder = "!!! warning \"Acceptance coverage not available\"\n    Run `make coverage-acceptance` to generate acceptance test coverage."
-            markdown = re.sub(r"<!-- coverage:acceptance(?::summary)? -->", placeholder, markdown)
-
-    # Process acceptance test matrix placeholders (pass/fail by driver)
-    if "<!-- acceptance:matrix" in markdown:
-        if acceptance_results_dir.exists() and any(acceptance_results_dir.glob("*.json")):
-            data = parse_acceptance_results(acceptance_results_dir)
-            # Full table
-            if "<!-- acceptance:matrix -->" in markdown:
-                table = acceptance_to_markdown(data, detail=True)
-                markdown = markdown.replace("<!-- acceptance:matrix -->", table)
-            # Summary only
-            if "<!-- acceptance:matrix:summary -->" in markdown:
-                summary = acceptance_to_markdown(data, detail=False)
-                markdown = markdown.replace("<!-- acceptance:matrix:summary -->", summary)
-        else:
-            placeholder = "!!! warning \"Acceptance test results not available\"\n    Run `make test-acceptance` to generate test results."
-            markdown = re.sub(r"<!-- acceptance:matrix(?::summary)? -->", placeholder, markdown)
+    # Nothing to do if no page source uses a placeholder (see on_files)
+    if _used_sections is not None and not _used_sections:
+        return markdown
+
+    # Most pages have no placeholders; return them untouched
+    if PLACEHOLDER_RE.search(markdown) is None:
+        return markdown
+
+    # Replace every placeholder in one pass with the sections rendered by on_files
+    def replace(match):
+        section, detail = match[1], match[2] is None
+        rendered = _rendered.get(section)
+        if rendered is None:
+            # on_files has not rendered this section; render (and cache) it now
+            return _section_markdown(section, detail)
+        return rendered.result()[detail]
 
-    return markdown
+    return PLACEHOLDER_RE.sub(replace, markdown)
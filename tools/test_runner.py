@@ -10,52 +10,119 @@ Usage:
 """
 
 import argparse
+import contextlib
+import functools
 import glob
+import hashlib
+import io
+import itertools
 import json
+import multiprocessing
 import os
+import pickle
+import re
+import shlex
 import shutil
 import subprocess
 import sys
 import tempfile
-from dataclasses import dataclass, asdict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import yaml
+# orjson encodes JSON much faster; the stdlib module is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# File placeholders in CLI test commands: {config_file}, or {name} for given.files
+PLACEHOLDER_RE = re.compile(r"\{([^{}]+)\}")
+
+# Runner caches, kept between invocations
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "holoconf"
+
+# Parsed test suites from earlier runs, reused while their YAML files are unchanged
+SUITE_CACHE_DIR = CACHE_DIR / "test_suite"
+
+# Test files matched by earlier runs, per pattern, reused while no directory changed
+DISCOVER_CACHE = CACHE_DIR / "discover.json"
+
+# The usual test file pattern, <dir>/**/*<suffix> (e.g. tests/acceptance/**/*.yaml),
+# which discover matches with plain directory walks instead of glob
+RECURSIVE_SUFFIX_RE = re.compile(r"([^*?\[\]]+)/\*\*/\*(\.[^*?\[\]/]+)")
+
+
+# Dataclass options for the per-test records: __slots__ where supported (3.10+)
+# keeps thousands of them small and quick to read
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# What a test does, from the keys of its `when`, in precedence order: an export
+# test may also name an access path
+TEST_ACTIONS = ("cli", "dump", "export", "access", "validate")
+
+# Types compared numerically by values_equal (bool is an int subclass)
+_NUMBER_TYPES = frozenset((int, float, bool))
+
+# Types values_equal compares with plain == when both sides have the same one
+_SCALAR_TYPES = frozenset((str, int, float, bool))
 
 
 def values_equal(actual: Any, expected: Any) -> bool:
     """Compare values flexibly, handling type differences."""
+    # Most comparisons are exact matches, which == checks in C; only a mismatch
+    # needs the flexible comparison below
+    try:
+        if actual == expected:
+            return True
+    except Exception:
+        pass
+
+    # Values are plain YAML/JSON types, so exact type checks suffice (and are
+    # cheaper than isinstance)
+    actual_type = type(actual)
+    expected_type = type(expected)
+
+    # Scalars of the same type (most YAML leaves) that == rejected are different
+    if actual_type is expected_type and actual_type in _SCALAR_TYPES:
+        return False
+
     # If both are dicts, compare key-value pairs
-    if isinstance(actual, dict) and isinstance(expected, dict):
-        if set(actual.keys()) != set(expected.keys()):
+    if actual_type is dict and expected_type is dict:
+        if actual.keys() != expected.keys():
             return False
         return all(values_equal(actual[k], expected[k]) for k in actual)
 
     # If both are lists, compare elements
-    if isinstance(actual, list) and isinstance(expected, list):
+    if actual_type is list and expected_type is list:
         if len(actual) != len(expected):
             return False
         return all(values_equal(a, e) for a, e in zip(actual, expected))
 
     # Handle numeric comparisons
-    if isinstance(actual, (int, float)) and isinstance(expected, (int, float)):
+    if actual_type in _NUMBER_TYPES and expected_type in _NUMBER_TYPES:
         return actual == expected
 
     # Fall back to string comparison for other types
     return str(actual) == str(expected)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TestCase:
     """A single test case from a YAML file."""
     name: str
     given: Dict[str, Any]
     when: Dict[str, Any]
     then: Dict[str, Any]
+    action: str = field(init=False)  # First of TEST_ACTIONS in when, else ""
+
+    def __post_init__(self):
+        self.action = next((action for action in TEST_ACTIONS if action in self.when), "")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TestSuite:
     """A collection of test cases from a YAML file."""
     name: str
@@ -64,7 +131,7 @@ class TestSuite:
     file_path: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TestResult:
     """Result of running a single test."""
     test_name: str
@@ -78,15 +145,22 @@ class TestResult:
 class Driver:
     """Base class for language-specific test drivers."""
 
-    def setup_env(self, env: Dict[str, str]) -> None:
-        """Set up environment variables for the test."""
-        for key, value in env.items():
-            os.environ[key] = value
+    def setup_env(self, env: Dict[str, str]) -> Dict[str, Optional[str]]:
+        """Set up environment variables for the test.
 
-    def cleanup_env(self, env: Dict[str, str]) -> None:
-        """Clean up environment variables after the test."""
-        for key in env.keys():
-            os.environ.pop(key, None)
+        Returns the variables' previous values (None if unset) for cleanup_env.
+        """
+        saved = {key: os.environ.get(key) for key in env}
+        os.environ.update(env)
+        return saved
+
+    def cleanup_env(self, saved: Dict[str, Optional[str]]) -> None:
+        """Restore environment variables to the values setup_env returned."""
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
 
     def load_config(self, yaml_content: str, base_path: Optional[str] = None) -> Any:
         """Load configuration from YAML string."""
@@ -242,6 +316,9 @@ class RustDriver(Driver):
             )
         # Find the holoconf CLI binary
         self.cli_path = self._find_cli()
+        # Plain-dict snapshot of the environment for CLI runs; copying os.environ
+        # itself re-decodes every variable
+        self._base_env = dict(os.environ)
 
     def _find_cli(self) -> Optional[str]:
         """Find the holoconf CLI binary."""
@@ -262,15 +339,13 @@ class RustDriver(Driver):
             raise RuntimeError(
                 "holoconf CLI not found. Build with: cargo build --release"
             )
-        full_command = f"{self.cli_path} {command}"
-        env_copy = os.environ.copy()
-        env_copy.update(env)
+        # Run the binary directly rather than through an extra /bin/sh. Without
+        # test variables the child simply inherits this environment.
         result = subprocess.run(
-            full_command,
-            shell=True,
+            [self.cli_path, *shlex.split(command)],
             capture_output=True,
             text=True,
-            env=env_copy,
+            env={**self._base_env, **env} if env else None,
         )
         return result.returncode, result.stdout, result.stderr
 
@@ -379,6 +454,9 @@ class PythonDriver(Driver):
                 "Could not import holoconf. "
                 "Build with: cd packages/python/holoconf && maturin develop"
             )
+        # Plain-dict snapshot of the environment for CLI runs; copying os.environ
+        # itself re-decodes every variable
+        self._base_env = dict(os.environ)
 
     def setup_mocks(self, mocks: Dict[str, Any], is_async: bool = False) -> None:
         """Set up mock resolvers from test definition."""
@@ -391,16 +469,17 @@ class PythonDriver(Driver):
             self.register_resolver(resolver_name, mock_resolver, force=True)
 
     def run_cli(self, command: str, env: Dict[str, str]) -> Tuple[int, str, str]:
-        """Run CLI command via Python module and return (exit_code, stdout, stderr)."""
-        full_command = f"{sys.executable} -m holoconf {command}"
-        env_copy = os.environ.copy()
-        env_copy.update(env)
+        """Run CLI command via Python module and return (exit_code, stdout, stderr).
+
+        Each command gets a fresh interpreter, so tests exercise the real
+        `python -m holoconf` entry point and share no process state.
+        """
+        # Run the interpreter directly rather than through an extra /bin/sh
         result = subprocess.run(
-            full_command,
-            shell=True,
+            [sys.executable, "-m", "holoconf", *shlex.split(command)],
             capture_output=True,
             text=True,
-            env=env_copy,
+            env={**self._base_env, **env} if env else None,
         )
         return result.returncode, result.stdout, result.stderr
 
@@ -497,8 +576,15 @@ def load_driver(name: str) -> Driver:
 
 def load_test_suite(file_path: str) -> TestSuite:
     """Load a test suite from a YAML file."""
+    # Imported here: with a warm suite cache (see load_test_suite_cached) no YAML
+    # is parsed, so the runner does not pay for importing it
+    import yaml
+
+    # Prefer libyaml's C loader when PyYAML was built with it (both loaders are safe)
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    # Parse the whole text at once rather than letting the loader read the stream
     with open(file_path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f.read(), Loader=loader)  # noqa: S506
 
     tests = []
     for test_data in data.get("tests", []):
@@ -517,6 +603,51 @@ def load_test_suite(file_path: str) -> TestSuite:
     )
 
 
+def _file_stamp(path: str) -> Tuple[int, int]:
+    """Modification time and size of a file; a rewrite changes at least one of them."""
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def load_test_suite_cached(file_path: str) -> TestSuite:
+    """Load a test suite, reusing the one parsed by an earlier run if nothing changed.
+
+    Suites are pickled under SUITE_CACHE_DIR, one entry per file and Python
+    version (interpreters differ in pickle protocol). A cached suite is used
+    only if both its YAML file and this runner (which defines the pickled
+    classes) are unchanged since it was written.
+    """
+    version = tuple(sys.version_info[:2])
+    stamp = (_file_stamp(file_path), _file_stamp(__file__), version)
+    key_source = f"{os.path.abspath(file_path)}|{version}"
+    key = hashlib.sha256(key_source.encode()).hexdigest()[:16]
+    cache_file = SUITE_CACHE_DIR / f"{key}.pkl"
+
+    try:
+        with open(cache_file, "rb") as f:
+            # Entries are written by this runner into the user's own cache directory
+            cached_stamp, suite = pickle.load(f)  # noqa: S301
+        if cached_stamp == stamp:
+            suite.file_path = file_path
+            return suite
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        # Missing, unreadable, truncated or stale cache entry: parse the YAML instead
+        pass
+
+    suite = load_test_suite(file_path)
+    # The cache is only an optimisation; failing to write it is not an error
+    try:
+        SUITE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so a concurrent run never reads a partial file
+        partial = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(partial, "wb") as f:
+            pickle.dump((stamp, suite), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(partial, cache_file)
+    except OSError:
+        pass
+    return suite
+
+
 def run_cli_test(
     driver: Driver,
     test: TestCase,
@@ -527,10 +658,11 @@ def run_cli_test(
     """Run a CLI-based test."""
     command_template = test.when["cli"]
 
-    # Substitute file placeholders like {config_file}, {schema_file}
-    command = command_template
-    for placeholder, filepath in temp_files.items():
-        command = command.replace(f"{{{placeholder}}}", filepath)
+    # Substitute file placeholders like {config_file}, {schema_file} in one pass;
+    # anything else in braces is left as written
+    command = PLACEHOLDER_RE.sub(
+        lambda match: temp_files.get(match[1], match[0]), command_template
+    )
 
     try:
         exit_code, stdout, stderr = driver.run_cli(command, env)
@@ -589,8 +721,9 @@ def run_cli_test(
         contains = test.then["stderr_contains"]
         if isinstance(contains, str):
             contains = [contains]
+        stderr_lower = stderr.lower()
         for expected in contains:
-            if expected.lower() not in stderr.lower():
+            if expected.lower() not in stderr_lower:
                 return TestResult(
                     test_name=test.name,
                     suite_name=suite_name,
@@ -692,6 +825,296 @@ def run_dump_test(
     )
 
 
+# Directory holding the temp directories of every test in a run (set by run_tests
+# and _init_worker). It is removed once at the end of the run, not per test.
+_temp_root: Optional[str] = None
+_temp_count = itertools.count()
+
+
+def _set_temp_root(temp_root: Optional[str]) -> None:
+    """Set (or clear) the directory that new test temp directories are created in."""
+    global _temp_root
+    _temp_root = temp_root
+
+
+def _temp_parent() -> Optional[str]:
+    """Where to put test temp directories: $HOLOCONF_TMPDIR, else RAM-backed /dev/shm.
+
+    Returns None (tempfile's default directory) where /dev/shm is unavailable.
+    """
+    configured = os.environ.get("HOLOCONF_TMPDIR")
+    if configured:
+        return configured
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return None
+
+
+def _make_test_dir() -> str:
+    """Create an empty temp directory for one test."""
+    if _temp_root is None:
+        return tempfile.mkdtemp(prefix="holoconf_test_", dir=_temp_parent())
+    # Include the pid: worker processes share the run's temp root
+    temp_dir = os.path.join(_temp_root, f"{os.getpid()}-{next(_temp_count)}")
+    os.mkdir(temp_dir)
+    return temp_dir
+
+
+def _write_fixtures(fixtures: List[Tuple[str, str]]) -> None:
+    """Write (path, content) fixture files, each with one open, write and close."""
+    for path, content in fixtures:
+        data = memoryview(content.encode())
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # A single write normally suffices; loop in case it is short
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Keys of a dotted access path; suites reuse the same paths many times."""
+    return tuple(path.split("."))
+
+
+@functools.lru_cache(maxsize=128)
+def _load_schema(driver: Driver, yaml_content: str) -> Any:
+    """driver.load_schema, reusing the Schema parsed from the same YAML earlier.
+
+    Schemas are never modified once parsed, so tests can share them.
+    """
+    return driver.load_schema(yaml_content)
+
+
+def run_export_test(driver: Driver, test: TestCase, suite_name: str, config: Any) -> TestResult:
+    """Run a serialization export test against a loaded config."""
+    export_format = test.when["export"]
+    resolve = test.when.get("resolve", True)
+    redact = test.when.get("redact", False)
+
+    if export_format == "yaml":
+        result = driver.export_yaml(config, resolve=resolve, redact=redact)
+    elif export_format == "json":
+        result = driver.export_json(config, resolve=resolve, redact=redact)
+    elif export_format == "dict":
+        result = driver.export_dict(config, resolve=resolve, redact=redact)
+        # If we need to access a key from the dict
+        if "access" in test.when:
+            path = test.when["access"]
+            # Navigate the dict by path
+            for part in _split_path(path):
+                result = result[part]
+    else:
+        return TestResult(
+            test_name=test.name,
+            suite_name=suite_name,
+            passed=False,
+            error=f"Unknown export format: {export_format}",
+        )
+
+    # Substring checks run against the text of the export, built once
+    if "contains" in test.then or "not_contains" in test.then:
+        result_text = result if type(result) is str else str(result)
+
+    # Check contains
+    if "contains" in test.then:
+        for expected in test.then["contains"]:
+            if expected not in result_text:
+                return TestResult(
+                    test_name=test.name,
+                    suite_name=suite_name,
+                    passed=False,
+                    error="Export missing expected content",
+                    expected=f"contains '{expected}'",
+                    actual=result_text[:200],
+                )
+
+    # Check not_contains
+    if "not_contains" in test.then:
+        for unexpected in test.then["not_contains"]:
+            if unexpected in result_text:
+                return TestResult(
+                    test_name=test.name,
+                    suite_name=suite_name,
+                    passed=False,
+                    error="Export contains unexpected content",
+                    expected=f"does not contain '{unexpected}'",
+                    actual=result_text[:200],
+                )
+
+    # Check value
+    if "value" in test.then:
+        expected = test.then["value"]
+        if not values_equal(result, expected):
+            return TestResult(
+                test_name=test.name,
+                suite_name=suite_name,
+                passed=False,
+                error="Export value mismatch",
+                expected=expected,
+                actual=result,
+            )
+
+    return TestResult(
+        test_name=test.name,
+        suite_name=suite_name,
+        passed=True,
+    )
+
+
+def run_access_test(driver: Driver, test: TestCase, suite_name: str, config: Any) -> TestResult:
+    """Run a value access test against a loaded config."""
+    path = test.when["access"]
+    # If a schema is provided, attach it for default value lookup
+    schema_yaml = test.given.get("schema", "")
+    if schema_yaml:
+        schema = _load_schema(driver, schema_yaml)
+        driver.set_schema(config, schema)
+    try:
+        result = driver.access(config, path)
+    except Exception as e:
+        # Check if we expected an error
+        if "error" in test.then:
+            expected_type = test.then["error"].get("type", "")
+            message_contains = test.then["error"].get("message_contains", "")
+
+            error_str = str(e)
+            if message_contains and message_contains not in error_str:
+                return TestResult(
+                    test_name=test.name,
+                    suite_name=suite_name,
+                    passed=False,
+                    error=f"Error message mismatch",
+                    expected=f"contains '{message_contains}'",
+                    actual=error_str,
+                )
+
+            return TestResult(
+                test_name=test.name,
+                suite_name=suite_name,
+                passed=True,
+            )
+        else:
+            return TestResult(
+                test_name=test.name,
+                suite_name=suite_name,
+                passed=False,
+                error=f"Unexpected error: {e}",
+            )
+
+    # Check expected value
+    if "value" in test.then:
+        expected = test.then["value"]
+        if not values_equal(result, expected):
+            return TestResult(
+                test_name=test.name,
+                suite_name=suite_name,
+                passed=False,
+                error="Value mismatch",
+                expected=expected,
+                actual=result,
+            )
+
+    # Check for expected error that didn't happen
+    if "error" in test.then:
+        return TestResult(
+            test_name=test.name,
+            suite_name=suite_name,
+            passed=False,
+            error="Expected error but got value",
+            expected=test.then["error"],
+            actual=result,
+        )
+
+    return TestResult(
+        test_name=test.name,
+        suite_name=suite_name,
+        passed=True,
+    )
+
+
+def run_validate_test(driver: Driver, test: TestCase, suite_name: str, config: Any) -> TestResult:
+    """Run a schema validation test against a loaded config."""
+    schema_yaml = test.given.get("schema", "")
+    schema = _load_schema(driver, schema_yaml)
+
+    try:
+        driver.validate(config, schema)
+        # Validation passed
+        if "valid" in test.then:
+            if test.then["valid"]:
+                return TestResult(
+                    test_name=test.name,
+                    suite_name=suite_name,
+                    passed=True,
+                )
+            else:
+                return TestResult(
+                    test_name=test.name,
+                    suite_name=suite_name,
+                    passed=False,
+                    error="Expected validation to fail but it passed",
+                )
+        if "error" in test.then:
+            return TestResult(
+                test_name=test.name,
+                suite_name=suite_name,
+                passed=False,
+                error="Expected validation error but validation passed",
+                expected=test.then["error"],
+            )
+    except Exception as e:
+        # Validation failed
+        if "valid" in test.then and test.then["valid"]:
+            return TestResult(
+                test_name=test.name,
+                suite_name=suite_name,
+                passed=False,
+                error="Expected validation to pass but it failed",
+                actual=str(e),
+            )
+        if "error" in test.then:
+            message_contains = test.then["error"].get("message_contains", "")
+            error_str = str(e)
+            if message_contains and message_contains not in error_str:
+                return TestResult(
+                    test_name=test.name,
+                    suite_name=suite_name,
+                    passed=False,
+                    error="Validation error message mismatch",
+                    expected=f"contains '{message_contains}'",
+                    actual=error_str,
+                )
+            return TestResult(
+                test_name=test.name,
+                suite_name=suite_name,
+                passed=True,
+            )
+        # Error expected implicitly (valid: false)
+        if "valid" in test.then and not test.then["valid"]:
+            return TestResult(
+                test_name=test.name,
+                suite_name=suite_name,
+                passed=True,
+            )
+
+    return TestResult(
+        test_name=test.name,
+        suite_name=suite_name,
+        passed=True,
+    )
+
+
+# Runners for the actions that work on a config loaded by run_test
+CONFIG_ACTIONS = {
+    "export": run_export_test,
+    "access": run_access_test,
+    "validate": run_validate_test,
+}
+
+
 def run_test(driver: Driver, test: TestCase, suite_name: str) -> TestResult:
     """Run a single test case."""
     env = test.given.get("env", {})
@@ -704,55 +1127,66 @@ def run_test(driver: Driver, test: TestCase, suite_name: str) -> TestResult:
     resolver_async = test.given.get("resolver_async", False)  # Use async mocks
     temp_dir = None
     temp_files = {}  # Track created temp files for CLI substitution
+    saved_env = None  # Set once the test's env is applied
 
     try:
-        # Set up environment
-        driver.setup_env(env)
-
         # Set up mock resolvers before any config loading
         if mocks and hasattr(driver, 'setup_mocks'):
             driver.setup_mocks(mocks, is_async=resolver_async)
 
         # Create temp directory
-        temp_dir = tempfile.mkdtemp(prefix="holoconf_test_")
+        temp_dir = _make_test_dir()
         base_path = temp_dir
 
-        # Set up explicit files first
+        # Collect fixture files as (path, content), explicit files first, and write
+        # them together below
+        fixtures = []
         if files:
+            # Most files sit directly in temp_dir; create each other parent once
+            created_dirs = {temp_dir}
             for filename, content in files.items():
-                file_path = Path(temp_dir) / filename
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                file_path.write_text(content)
-                temp_files[filename] = str(file_path)
+                file_path = os.path.join(temp_dir, filename)
+                parent = os.path.dirname(file_path)
+                if parent not in created_dirs:
+                    os.makedirs(parent, exist_ok=True)
+                    created_dirs.add(parent)
+                fixtures.append((file_path, content))
+                temp_files[filename] = file_path
 
         # Create temp config file(s) from given.config
         config_yaml = test.given.get("config", "")
         config_raw = test.given.get("config_raw", "")  # Raw content, don't parse
         if config_yaml or config_raw:
-            config_file = Path(temp_dir) / "config.yaml"
-            config_file.write_text(config_raw if config_raw else config_yaml)
-            temp_files["config_file"] = str(config_file)
+            config_file = os.path.join(temp_dir, "config.yaml")
+            fixtures.append((config_file, config_raw if config_raw else config_yaml))
+            temp_files["config_file"] = config_file
 
         # Create temp config2 file if present
         config2_yaml = test.given.get("config2", "")
         if config2_yaml:
-            config2_file = Path(temp_dir) / "config2.yaml"
-            config2_file.write_text(config2_yaml)
-            temp_files["config2_file"] = str(config2_file)
+            config2_file = os.path.join(temp_dir, "config2.yaml")
+            fixtures.append((config2_file, config2_yaml))
+            temp_files["config2_file"] = config2_file
 
         # Create temp schema file if present
         schema_yaml = test.given.get("schema", "")
         if schema_yaml:
-            schema_file = Path(temp_dir) / "schema.yaml"
-            schema_file.write_text(schema_yaml)
-            temp_files["schema_file"] = str(schema_file)
+            schema_file = os.path.join(temp_dir, "schema.yaml")
+            fixtures.append((schema_file, schema_yaml))
+            temp_files["schema_file"] = schema_file
+
+        _write_fixtures(fixtures)
 
-        # Handle CLI tests first (don't need to load config into memory)
-        if "cli" in test.when:
+        # Handle CLI tests first (don't need to load config into memory). The CLI
+        # process is given the test's environment variables directly.
+        if test.action == "cli":
             return run_cli_test(driver, test, suite_name, temp_files, env)
 
+        # Library calls read variables from this process's environment
+        saved_env = driver.setup_env(env)
+
         # Handle dump tests (test the dump/export functionality)
-        if "dump" in test.when:
+        if test.action == "dump":
             return run_dump_test(driver, test, suite_name, temp_files, base_path)
 
         # For non-CLI tests, load config into memory
@@ -761,7 +1195,7 @@ def run_test(driver: Driver, test: TestCase, suite_name: str) -> TestResult:
         try:
             if config_glob:
                 # Load files matching glob pattern
-                glob_pattern = str(Path(temp_dir) / config_glob)
+                glob_pattern = os.path.join(temp_dir, config_glob)
                 config = driver.load_glob(glob_pattern, required=glob_required)
             elif config_merge_specs:
                 # Merge multiple files with optional support
@@ -769,16 +1203,16 @@ def run_test(driver: Driver, test: TestCase, suite_name: str) -> TestResult:
                 specs = []
                 for spec in config_merge_specs:
                     if isinstance(spec, str):
-                        specs.append({"path": str(Path(temp_dir) / spec), "optional": False})
+                        specs.append({"path": os.path.join(temp_dir, spec), "optional": False})
                     else:
                         specs.append({
-                            "path": str(Path(temp_dir) / spec["path"]),
+                            "path": os.path.join(temp_dir, spec["path"]),
                             "optional": spec.get("optional", False),
                         })
                 config = driver.load_merged_with_specs(specs)
             elif config_merge:
                 # Merge multiple files (backwards compatible)
-                file_paths = [str(Path(temp_dir) / f) for f in config_merge]
+                file_paths = [os.path.join(temp_dir, f) for f in config_merge]
                 config = driver.load_merged(file_paths)
             elif config_yaml:
                 config = driver.load_config(config_yaml, base_path=base_path)
@@ -813,206 +1247,10 @@ def run_test(driver: Driver, test: TestCase, suite_name: str) -> TestResult:
                     error=f"Unexpected error during config loading: {load_error}",
                 )
 
-        # Execute action - check export first since it may also have access
-        if "export" in test.when:
-            # Serialization export test
-            export_format = test.when["export"]
-            resolve = test.when.get("resolve", True)
-            redact = test.when.get("redact", False)
-
-            if export_format == "yaml":
-                result = driver.export_yaml(config, resolve=resolve, redact=redact)
-            elif export_format == "json":
-                result = driver.export_json(config, resolve=resolve, redact=redact)
-            elif export_format == "dict":
-                result = driver.export_dict(config, resolve=resolve, redact=redact)
-                # If we need to access a key from the dict
-                if "access" in test.when:
-                    path = test.when["access"]
-                    # Navigate the dict by path
-                    parts = path.split(".")
-                    for part in parts:
-                        result = result[part]
-            else:
-                return TestResult(
-                    test_name=test.name,
-                    suite_name=suite_name,
-                    passed=False,
-                    error=f"Unknown export format: {export_format}",
-                )
-
-            # Check contains
-            if "contains" in test.then:
-                for expected in test.then["contains"]:
-                    if expected not in str(result):
-                        return TestResult(
-                            test_name=test.name,
-                            suite_name=suite_name,
-                            passed=False,
-                            error="Export missing expected content",
-                            expected=f"contains '{expected}'",
-                            actual=str(result)[:200],
-                        )
-
-            # Check not_contains
-            if "not_contains" in test.then:
-                for unexpected in test.then["not_contains"]:
-                    if unexpected in str(result):
-                        return TestResult(
-                            test_name=test.name,
-                            suite_name=suite_name,
-                            passed=False,
-                            error="Export contains unexpected content",
-                            expected=f"does not contain '{unexpected}'",
-                            actual=str(result)[:200],
-                        )
-
-            # Check value
-            if "value" in test.then:
-                expected = test.then["value"]
-                if not values_equal(result, expected):
-                    return TestResult(
-                        test_name=test.name,
-                        suite_name=suite_name,
-                        passed=False,
-                        error="Export value mismatch",
-                        expected=expected,
-                        actual=result,
-                    )
-
-            return TestResult(
-                test_name=test.name,
-                suite_name=suite_name,
-                passed=True,
-            )
-
-        elif "access" in test.when:
-            path = test.when["access"]
-            # If a schema is provided, attach it for default value lookup
-            schema_yaml = test.given.get("schema", "")
-            if schema_yaml:
-                schema = driver.load_schema(schema_yaml)
-                driver.set_schema(config, schema)
-            try:
-                result = driver.access(config, path)
-            except Exception as e:
-                # Check if we expected an error
-                if "error" in test.then:
-                    expected_type = test.then["error"].get("type", "")
-                    message_contains = test.then["error"].get("message_contains", "")
-
-                    error_str = str(e)
-                    if message_contains and message_contains not in error_str:
-                        return TestResult(
-                            test_name=test.name,
-                            suite_name=suite_name,
-                            passed=False,
-                            error=f"Error message mismatch",
-                            expected=f"contains '{message_contains}'",
-                            actual=error_str,
-                        )
-
-                    return TestResult(
-                        test_name=test.name,
-                        suite_name=suite_name,
-                        passed=True,
-                    )
-                else:
-                    return TestResult(
-                        test_name=test.name,
-                        suite_name=suite_name,
-                        passed=False,
-                        error=f"Unexpected error: {e}",
-                    )
-
-            # Check expected value
-            if "value" in test.then:
-                expected = test.then["value"]
-                if not values_equal(result, expected):
-                    return TestResult(
-                        test_name=test.name,
-                        suite_name=suite_name,
-                        passed=False,
-                        error="Value mismatch",
-                        expected=expected,
-                        actual=result,
-                    )
-
-            # Check for expected error that didn't happen
-            if "error" in test.then:
-                return TestResult(
-                    test_name=test.name,
-                    suite_name=suite_name,
-                    passed=False,
-                    error="Expected error but got value",
-                    expected=test.then["error"],
-                    actual=result,
-                )
-
-        elif "validate" in test.when:
-            # Schema validation test
-            schema_yaml = test.given.get("schema", "")
-            schema = driver.load_schema(schema_yaml)
-
-            try:
-                driver.validate(config, schema)
-                # Validation passed
-                if "valid" in test.then:
-                    if test.then["valid"]:
-                        return TestResult(
-                            test_name=test.name,
-                            suite_name=suite_name,
-                            passed=True,
-                        )
-                    else:
-                        return TestResult(
-                            test_name=test.name,
-                            suite_name=suite_name,
-                            passed=False,
-                            error="Expected validation to fail but it passed",
-                        )
-                if "error" in test.then:
-                    return TestResult(
-                        test_name=test.name,
-                        suite_name=suite_name,
-                        passed=False,
-                        error="Expected validation error but validation passed",
-                        expected=test.then["error"],
-                    )
-            except Exception as e:
-                # Validation failed
-                if "valid" in test.then and test.then["valid"]:
-                    return TestResult(
-                        test_name=test.name,
-                        suite_name=suite_name,
-                        passed=False,
-                        error="Expected validation to pass but it failed",
-                        actual=str(e),
-                    )
-                if "error" in test.then:
-                    message_contains = test.then["error"].get("message_contains", "")
-                    error_str = str(e)
-                    if message_contains and message_contains not in error_str:
-                        return TestResult(
-                            test_name=test.name,
-                            suite_name=suite_name,
-                            passed=False,
-                            error="Validation error message mismatch",
-                            expected=f"contains '{message_contains}'",
-                            actual=error_str,
-                        )
-                    return TestResult(
-                        test_name=test.name,
-                        suite_name=suite_name,
-                        passed=True,
-                    )
-                # Error expected implicitly (valid: false)
-                if "valid" in test.then and not test.then["valid"]:
-                    return TestResult(
-                        test_name=test.name,
-                        suite_name=suite_name,
-                        passed=True,
-                    )
+        # Tests without an action only check that the config loads
+        run_action = CONFIG_ACTIONS.get(test.action)
+        if run_action is not None:
+            return run_action(driver, test, suite_name, config)
 
         return TestResult(
             test_name=test.name,
@@ -1029,87 +1267,384 @@ def run_test(driver: Driver, test: TestCase, suite_name: str) -> TestResult:
         )
 
     finally:
-        driver.cleanup_env(env)
-        if temp_dir:
+        if saved_env is not None:
+            driver.cleanup_env(saved_env)
+        # Directories under the run's temp root are removed with it
+        if temp_dir and _temp_root is None:
             shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+class ResultsWriter:
+    """Writes the --json results file one suite at a time.
+
+    Only the current suite's results are held in memory. The file is built
+    under a temporary name and renamed into place by finish(), so a run that
+    fails part way leaves no truncated results behind.
+    """
+
+    def __init__(self, path: str, driver_name: str, pretty: bool = False):
+        self.path = path
+        self.pretty = pretty
+        self._suite_count = 0
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._partial = f"{path}.{os.getpid()}.tmp"
+        self._file = open(self._partial, "w", encoding="utf-8")
+        if pretty:
+            self._file.write(f'{{\n  "driver": {self._encode(driver_name)},\n  "suites": [')
+        else:
+            self._file.write(f'{{"driver":{self._encode(driver_name)},"suites":[')
+
+    @staticmethod
+    def _json_default(value: Any) -> Any:
+        """JSON for a TestResult: the fields reported per test, encoded directly."""
+        if type(value) is TestResult:
+            return {"name": value.test_name, "passed": value.passed, "error": value.error}
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    def _encode(self, value: Any, depth: int = 0) -> str:
+        """Encode a value as JSON, indented to sit depth levels deep when pretty.
+
+        Compact unless asked otherwise: the stdlib only uses its C encoder
+        without indent.
+        """
+        default = self._json_default
+        if orjson:
+            # Send dataclasses to default rather than serializing every field
+            option = orjson.OPT_PASSTHROUGH_DATACLASS
+            if self.pretty:
+                option |= orjson.OPT_INDENT_2
+            text = orjson.dumps(value, default=default, option=option).decode()
+        elif self.pretty:
+            text = json.dumps(value, default=default, indent=2)
+        else:
+            text = json.dumps(value, default=default, separators=(",", ":"))
+        # Newlines only occur between tokens (strings escape theirs)
+        return text.replace("\n", "\n" + "  " * depth) if self.pretty else text
+
+    def write_suite(self, suite_data: Dict[str, Any]) -> None:
+        """Append one suite's results; its "tests" may hold TestResult objects."""
+        separator = "," if self._suite_count else ""
+        if self.pretty:
+            self._file.write(f"{separator}\n    {self._encode(suite_data, depth=2)}")
+        else:
+            self._file.write(separator + self._encode(suite_data))
+        self._suite_count += 1
+
+    def finish(self, total: int, passed: int, failed: int) -> None:
+        """Write the totals and move the complete file into place."""
+        if self.pretty:
+            self._file.write(
+                f'\n  ],\n  "total": {total},\n  "passed": {passed},\n  "failed": {failed}\n}}'
+            )
+        else:
+            self._file.write(f'],"total":{total},"passed":{passed},"failed":{failed}}}')
+        self._file.close()
+        os.replace(self._partial, self.path)
+
+    def discard(self) -> None:
+        """Remove the partial file if finish() was not reached."""
+        if not self._file.closed:
+            self._file.close()
+            os.unlink(self._partial)
+
+
+# Driver of a test worker process, loaded once by _init_worker
+_worker_driver: Optional[Driver] = None
+
+
+def _init_worker(driver_name: str, temp_root: str) -> None:
+    """Load the driver in a new worker process and share the run's temp root."""
+    global _worker_driver
+    _worker_driver = load_driver(driver_name)
+    _set_temp_root(temp_root)
+
+
+def _run_in_worker(work: Tuple[TestCase, str]) -> TestResult:
+    """Run one (test, suite name) pair with the worker's driver."""
+    test, suite_name = work
+    return run_test(_worker_driver, test, suite_name)
+
+
+def _submit_to_worker(executor: ProcessPoolExecutor, work: Tuple[TestCase, str]) -> Future:
+    """Queue one (test, suite name) pair, even if the pool is already broken."""
+    try:
+        return executor.submit(_run_in_worker, work)
+    except BrokenProcessPool as e:
+        failed: Future = Future()
+        failed.set_exception(e)
+        return failed
+
+
+def _worker_result(future: Future, work: Tuple[TestCase, str]) -> TestResult:
+    """A worker's result, or a failed result if its worker process died."""
+    try:
+        return future.result()
+    except BrokenProcessPool as e:
+        test, suite_name = work
+        return TestResult(
+            test_name=test.name,
+            suite_name=suite_name,
+            passed=False,
+            error=f"Test worker process failed: {e}",
+        )
+
+
 def run_tests(
-    driver: Driver,
+    driver: Optional[Driver],
     test_files: List[str],
     verbose: bool = False,
     json_output: Optional[str] = None,
     driver_name: str = "unknown",
+    jobs: int = 1,
+    json_pretty: bool = False,
 ) -> bool:
-    """Run all tests from the given files."""
+    """Run all tests from the given files.
+
+    With jobs > 1, tests run in that many worker processes, each loading its own
+    driver (mock resolvers and environment variables are process-global), and
+    driver may be None. Results are still reported in file order; if a worker
+    process dies, its unfinished tests are reported as failed.
+    """
     total = 0
     passed = 0
     failed = 0
-    results: List[TestResult] = []
-    suites_data: List[Dict[str, Any]] = []
-
-    for file_path in test_files:
-        if verbose:
-            print(f"\n📁 {file_path}")
-
-        suite = load_test_suite(file_path)
-        suite_results = []
-
-        for test in suite.tests:
-            total += 1
-            result = run_test(driver, test, suite.name)
-            results.append(result)
-            suite_results.append(result)
-
-            if result.passed:
-                passed += 1
-                if verbose:
-                    print(f"  ✓ {test.name}")
-            else:
-                failed += 1
-                print(f"  ✗ {test.name}")
-                if result.error:
-                    print(f"    Error: {result.error}")
-                if result.expected is not None:
-                    print(f"    Expected: {result.expected}")
-                if result.actual is not None:
-                    print(f"    Actual: {result.actual}")
-
-        # Collect suite data for JSON output
-        suites_data.append({
-            "suite": suite.name,
-            "description": suite.description,
-            "file": file_path,
-            "tests": [
-                {
-                    "name": r.test_name,
-                    "passed": r.passed,
-                    "error": r.error,
-                }
-                for r in suite_results
-            ],
-        })
+
+    suites = [load_test_suite_cached(file_path) for file_path in test_files]
+    work = [(test, suite.name) for suite in suites for test in suite.tests]
+
+    with contextlib.ExitStack() as stack:
+        temp_root = stack.enter_context(tempfile.TemporaryDirectory(
+            prefix="holoconf_test_", dir=_temp_parent()
+        ))
+        _set_temp_root(temp_root)
+        stack.callback(_set_temp_root, None)
+
+        results_writer = None
+        if json_output:
+            results_writer = ResultsWriter(json_output, driver_name, pretty=json_pretty)
+            stack.callback(results_writer.discard)
+
+        if jobs > 1:
+            # Spawn rather than fork, so each worker loads the native bindings afresh
+            executor = stack.enter_context(ProcessPoolExecutor(
+                max_workers=jobs,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(driver_name, temp_root),
+            ))
+            # Queue CLI tests first: they mostly wait on their subprocess, so
+            # in-process tests queued behind them keep the other workers busy
+            # and a slow CLI test is less likely to be left running at the end.
+            # Results are still read back in file order.
+            futures: List[Any] = [None] * len(work)
+            for index in sorted(range(len(work)), key=lambda i: work[i][0].action != "cli"):
+                futures[index] = _submit_to_worker(executor, work[index])
+            outcomes = (_worker_result(future, item) for future, item in zip(futures, work))
+        else:
+            outcomes = (run_test(driver, test, suite_name) for test, suite_name in work)
+
+        for file_path, suite in zip(test_files, suites):
+            # Report each suite with one write rather than a write per line
+            out = io.StringIO()
+            if verbose:
+                print(f"\n📁 {file_path}", file=out)
+            suite_results = []
+
+            for test in suite.tests:
+                total += 1
+                result = next(outcomes)
+                suite_results.append(result)
+
+                if result.passed:
+                    passed += 1
+                    if verbose:
+                        print(f"  ✓ {test.name}", file=out)
+                else:
+                    failed += 1
+                    print(f"  ✗ {test.name}", file=out)
+                    if result.error:
+                        print(f"    Error: {result.error}", file=out)
+                    if result.expected is not None:
+                        print(f"    Expected: {result.expected}", file=out)
+                    if result.actual is not None:
+                        print(f"    Actual: {result.actual}", file=out)
+
+            sys.stdout.write(out.getvalue())
+            sys.stdout.flush()
+
+            # Write the suite's JSON results as soon as it is done
+            if results_writer:
+                results_writer.write_suite({
+                    "suite": suite.name,
+                    "description": suite.description,
+                    "file": file_path,
+                    "tests": suite_results,
+                })
+
+        if results_writer:
+            results_writer.finish(total=total, passed=passed, failed=failed)
 
     print(f"\n{'='*50}")
     print(f"Results: {passed}/{total} passed, {failed} failed")
-
-    # Write JSON output if requested
     if json_output:
-        output_data = {
-            "driver": driver_name,
-            "total": total,
-            "passed": passed,
-            "failed": failed,
-            "suites": suites_data,
-        }
-        Path(json_output).parent.mkdir(parents=True, exist_ok=True)
-        with open(json_output, "w") as f:
-            json.dump(output_data, f, indent=2)
         print(f"JSON results written to: {json_output}")
 
     return failed == 0
 
 
+def _pattern_root(pattern: str) -> str:
+    """Leading directories of a glob pattern, up to the first wildcard."""
+    parts = []
+    for part in Path(pattern).parts[:-1]:
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    return os.path.join(*parts) if parts else "."
+
+
+def _dir_stamps(root: str) -> Dict[str, int]:
+    """Modification times of root and every non-hidden directory below it.
+
+    Adding, removing or renaming a file changes the mtime of its directory, so
+    if none of these changed, a glob under root still has the same matches.
+    """
+    stamps = {}
+    for dirpath, dirnames, _ in os.walk(root):
+        # glob's ** does not descend into hidden directories either
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        stamps[dirpath] = os.stat(dirpath).st_mtime_ns
+    return stamps
+
+
+def _dirs_unchanged(stamps: Dict[str, int]) -> bool:
+    """Whether every directory recorded by _dir_stamps still has the same mtime."""
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in stamps.items())
+    except OSError:
+        return False
+
+
+def _walked_below(root: str, outer: str) -> bool:
+    """Whether a walk of outer reaches root below it (not through a hidden dir)."""
+    root = os.path.normpath(root)
+    outer = os.path.normpath(outer)
+    if not root.startswith(outer + os.sep):
+        return False
+    return not any(part.startswith(".") for part in root[len(outer) + 1:].split(os.sep))
+
+
+def _walk_patterns(patterns: List[str]) -> Dict[str, Tuple[List[str], Dict[str, int]]]:
+    """Match the RECURSIVE_SUFFIX_RE patterns among patterns, walking each directory once.
+
+    Returns {pattern: (files, _dir_stamps)} for those patterns only. A pattern
+    whose directory is inside another's (tests/acceptance in tests) is matched
+    during the outer walk. Matches are the same, and in the same order, as
+    glob's: hidden files and directories are skipped and directory symlinks
+    are followed.
+    """
+    suffixes = {}
+    for pattern in patterns:
+        match = RECURSIVE_SUFFIX_RE.fullmatch(pattern)
+        if match is not None:
+            suffixes[pattern] = match.groups()
+    results = {pattern: ([], {}) for pattern in suffixes}
+
+    # Patterns by (normalized) directory, where matching them starts
+    starts: Dict[str, List[str]] = {}
+    for pattern, (root, _) in suffixes.items():
+        starts.setdefault(os.path.normpath(root), []).append(pattern)
+    # Walk only from directories no other pattern's walk reaches
+    roots = {os.path.normpath(root): root for root, _ in reversed(list(suffixes.values()))}
+    walk_roots = [
+        root for root in roots.values()
+        if not any(_walked_below(root, outer) for outer in roots.values())
+    ]
+
+    for walk_root in walk_roots:
+        # Patterns being matched in each directory still to be visited, with
+        # the walk path of the directory where each one started
+        active_in = {walk_root: []}
+        for dirpath, dirnames, filenames in os.walk(walk_root, followlinks=True):
+            active = active_in.pop(dirpath)
+            active += [(pattern, dirpath) for pattern in starts.get(os.path.normpath(dirpath), [])]
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for dirname in dirnames:
+                active_in[os.path.join(dirpath, dirname)] = active
+            if not active:
+                continue
+
+            mtime = os.stat(dirpath).st_mtime_ns
+            names = [name for name in filenames if not name.startswith(".")]
+            for pattern, start in active:
+                root, suffix = suffixes[pattern]
+                # Spell paths from the pattern's own directory, as glob does
+                directory = root + dirpath[len(start):]
+                files, stamps = results[pattern]
+                stamps[directory] = mtime
+                files.extend(
+                    os.path.join(directory, name) for name in names if name.endswith(suffix)
+                )
+    return results
+
+
+def discover(patterns: List[str]) -> List[str]:
+    """Expand test file glob patterns, reusing earlier results where possible.
+
+    A pattern's matches are cached in DISCOVER_CACHE along with the mtime of
+    every directory under its root, and reused while none of those changed:
+    checking them is one stat per directory instead of listing each one.
+    A file matched by more than one pattern is only returned once.
+
+    Entries are keyed by the working directory and the pattern as written,
+    since both decide how glob spells the matched paths.
+    """
+    cwd = os.getcwd()
+    try:
+        cache = json.loads(DISCOVER_CACHE.read_text())
+    except (OSError, ValueError):
+        cache = {}
+
+    cached = {}
+    for pattern in patterns:
+        entry = cache.get(f"{cwd}|{pattern}")
+        if entry is not None and _dirs_unchanged(entry["dirs"]):
+            cached[pattern] = entry["files"]
+    # Match the rest together, so overlapping patterns share one walk
+    walked = _walk_patterns([pattern for pattern in patterns if pattern not in cached])
+
+    test_files = []
+    updated = False
+    for pattern in patterns:
+        if pattern in cached:
+            test_files.extend(cached[pattern])
+            continue
+
+        key = f"{cwd}|{pattern}"
+        if pattern in walked:
+            files, stamps = walked[pattern]
+        else:
+            files = glob.glob(pattern, recursive=True)
+            stamps = None
+        test_files.extend(files)
+        # Plain paths are cheaper to check than to cache
+        if glob.has_magic(pattern):
+            if stamps is None:
+                stamps = _dir_stamps(_pattern_root(pattern))
+            cache[key] = {"files": files, "dirs": stamps}
+            updated = True
+
+    # The cache is only an optimisation; failing to write it is not an error
+    if updated:
+        try:
+            DISCOVER_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            partial = DISCOVER_CACHE.with_suffix(f".{os.getpid()}.tmp")
+            partial.write_text(json.dumps(cache))
+            os.replace(partial, DISCOVER_CACHE)
+        except OSError:
+            pass
+    return list(dict.fromkeys(test_files))
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run holoconf acceptance tests")
     parser.add_argument(
@@ -1133,13 +1668,22 @@ def main():
         metavar="FILE",
         help="Write JSON results to FILE",
     )
+    parser.add_argument(
+        "--json-pretty",
+        action="store_true",
+        help="Indent the --json results for reading",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1, which runs tests in-process)",
+    )
 
     args = parser.parse_args()
 
     # Expand glob patterns
-    test_files = []
-    for pattern in args.test_files:
-        test_files.extend(glob.glob(pattern, recursive=True))
+    test_files = discover(args.test_files)
 
     if not test_files:
         print(f"No test files found for patterns: {args.test_files}")
@@ -1147,8 +1691,9 @@ def main():
 
     print(f"Running {len(test_files)} test file(s) with {args.driver} driver...")
 
+    # Worker processes load their own drivers
     try:
-        driver = load_driver(args.driver)
+        driver = load_driver(args.driver) if args.jobs <= 1 else None
     except ImportError as e:
         print(f"Error loading driver: {e}")
         sys.exit(1)
@@ -1159,6 +1704,8 @@ def main():
         verbose=args.verbose,
         json_output=args.json,
         driver_name=args.driver,
+        jobs=args.jobs,
+        json_pretty=args.json_pretty,
     )
     sys.exit(0 if success else 1)
 